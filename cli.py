@@ -11,158 +11,295 @@ Usage:
     python cli.py --interactive
 """
 
+from __future__ import annotations
+
 import argparse
+import copy
+import io
 import json
+import os
 import sys
-from pathlib import Path
+import textwrap
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
-from src.config import OPENAI_MODEL, validate_config
-from src.models import AgentResponse, AgentTrace
-from src.vector_store import initialize_vector_store
+# Add project root to path (os.path avoids importing pathlib at startup)
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
+# Heavy modules (agent graph, vector store, OpenAI clients) are imported
+# inside main() once we know the agent will actually run, so that --help
+# and argument errors return immediately.
+if TYPE_CHECKING:
+    from src.models import AgentResponse, AgentTrace
 
-# ANSI color codes for terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    RESET = '\033[0m'
 
+# ANSI color codes for terminal output. Disabled when stdout is not a
+# terminal or NO_COLOR is set, so piped output carries no escape bytes.
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
 
-def print_trace(trace: AgentTrace):
-    """Pretty print the agent execution trace.
+
+def _ansi(code: str) -> str:
+    return code if _USE_COLOR else ""
+
+
+HEADER = _ansi('\033[95m')
+BLUE = _ansi('\033[94m')
+CYAN = _ansi('\033[96m')
+GREEN = _ansi('\033[92m')
+YELLOW = _ansi('\033[93m')
+RED = _ansi('\033[91m')
+BOLD = _ansi('\033[1m')
+DIM = _ansi('\033[2m')
+RESET = _ansi('\033[0m')
+
+# Separators and banner, built once at import
+HEAVY_RULE = "═" * 70
+STEP_RULE = "─" * 50
+LIGHT_RULE = "─" * 60
+HEADER_BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║              🔌 Integration Agent CLI                        ║
+║         Configure API integrations with natural language     ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+# Precomputed `--help` output so the common help path skips argparse setup.
+# Must equal build_parser().format_help() at 80 columns; tests/test_cli.py
+# compares them exactly.
+HELP_TEXT = """\
+usage: cli.py [-h] [-c CONTEXT] [-f CONTEXT_FILE] [-i] [--debug]
+              [--model MODEL] [--json] [--compact] [--no-header]
+              [request]
+
+Integration Agent CLI - Configure API integrations with natural language
+
+positional arguments:
+  request               Natural language request for the integration
+
+options:
+  -h, --help            show this help message and exit
+  -c CONTEXT, --context CONTEXT
+                        JSON string with workflow variables (default: none)
+  -f CONTEXT_FILE, --context-file CONTEXT_FILE
+                        Path to JSON file with workflow variables
+  -i, --interactive     Run in interactive mode
+  --debug               Enable debug mode (shows agent reasoning steps)
+  --model MODEL         Override the model (default: $OPENAI_MODEL or gpt-5)
+  --json                Output response as JSON
+  --compact             Emit compact JSON with --json (default when stdout is
+                        not a terminal)
+  --no-header           Suppress the header banner
+
+Examples:
+  cli.py "Post the summary to Slack"
+  cli.py --context '{"summary": "test", "slack_channel": "#alerts"}' "Post to Slack"
+  cli.py --debug -f examples/slack_message.json
+  cli.py --interactive
+"""
+
+MISSING_REQUEST_ERROR = (
+    "Provide a request, use --interactive mode, or provide a context file with user_input"
+)
+
+# Fields emitted by --json; the trace is trimmed to steps, tool calls and duration
+JSON_OUTPUT_FIELDS = ("selected_action", "reasoning", "proposed_config")
+JSON_TRACE_FIELDS = {"steps", "tool_calls", "total_duration_ms"}
+
+# Configs longer than this are printed raw instead of re-indented as JSON
+PRETTY_CONFIG_MAX_CHARS = 10_000
+
+
+def _loads(data: str | bytes):
+    """Parse JSON text, using orjson when available.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    can keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _response_json(response: AgentResponse, pretty: bool = True) -> str:
+    """Serialize a response for --json output in a single pydantic pass.
+    
+    Args:
+        response: The AgentResponse to serialize
+        pretty: Indent the output; compact output is roughly twice as fast
+    """
+    include = dict.fromkeys(JSON_OUTPUT_FIELDS, True)
+    if response.trace:
+        include["trace"] = JSON_TRACE_FIELDS
+    return response.model_dump_json(include=include, indent=2 if pretty else None)
+
+
+def _shorten(text: str, width: int) -> str:
+    """Truncate text to about width chars, breaking on a word boundary.
+    
+    Falls back to a hard cut when the first word alone is too long
+    (URLs, IDs), where textwrap.shorten would leave only the placeholder.
+    """
+    if len(text) <= width:
+        return text
+    shortened = textwrap.shorten(text, width=width + 3, placeholder="...")
+    return shortened if shortened != "..." else text[:width] + "..."
+
+
+@lru_cache(maxsize=128)
+def _parse_value_cached(value: str):
+    """Parse a `set` value, memoized; callers must not mutate the result."""
+    try:
+        return _loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+def _parse_value(value: str):
+    """Parse an interactive `set` value as JSON, falling back to the raw string.
+    
+    Parsing is cached, but lists and dicts are deep-copied, so every `set`
+    gets its own object even when the same literal is entered twice.
+    """
+    parsed = _parse_value_cached(value)
+    if isinstance(parsed, (list, dict)):
+        return copy.deepcopy(parsed)
+    return parsed
+
+
+def _write_trace(trace: AgentTrace, out: io.StringIO):
+    """Render the agent execution trace into an output buffer.
     
     Args:
         trace: The execution trace to display
+        out: Buffer to write the rendered trace to
     """
-    print(f"\n{Colors.BOLD}{'═' * 70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}🔍 AGENT REASONING TRACE{Colors.RESET}")
-    print(f"{Colors.BOLD}{'═' * 70}{Colors.RESET}")
-    print(f"{Colors.DIM}Model: {trace.model_name} | Duration: {trace.total_duration_ms:.0f}ms | Tool Calls: {len(trace.tool_calls)}{Colors.RESET}")
-    print(f"{'═' * 70}")
+    print(f"\n{BOLD}{HEAVY_RULE}{RESET}", file=out)
+    print(f"{BOLD}{CYAN}🔍 AGENT REASONING TRACE{RESET}", file=out)
+    print(f"{BOLD}{HEAVY_RULE}{RESET}", file=out)
+    print(f"{DIM}Model: {trace.model_name} | Duration: {trace.total_duration_ms:.0f}ms | Tool Calls: {len(trace.tool_calls)}{RESET}", file=out)
+    print(HEAVY_RULE, file=out)
     
     for step in trace.steps:
-        print(f"\n{Colors.BOLD}{Colors.YELLOW}📍 Step {step.step_number}{Colors.RESET}")
-        print(f"{'─' * 50}")
+        print(f"\n{BOLD}{YELLOW}📍 Step {step.step_number}{RESET}", file=out)
+        print(STEP_RULE, file=out)
         
         if step.thought:
-            print(f"{Colors.CYAN}💭 Thought:{Colors.RESET}")
+            print(f"{CYAN}💭 Thought:{RESET}", file=out)
             # Word wrap the thought
-            thought_words = step.thought.split()
-            line = "   "
-            for word in thought_words:
-                if len(line) + len(word) > 67:
-                    print(line)
-                    line = "   " + word
-                else:
-                    line += " " + word if line.strip() else "   " + word
-            if line.strip():
-                print(line)
+            print(textwrap.fill(step.thought, width=70, initial_indent="   ", subsequent_indent="   "), file=out)
         
         if step.action:
-            print(f"\n{Colors.GREEN}🎬 Action:{Colors.RESET} {step.action}")
+            print(f"\n{GREEN}🎬 Action:{RESET} {step.action}", file=out)
         
         if step.action_input:
-            print(f"{Colors.BLUE}📥 Input:{Colors.RESET}")
+            print(f"{BLUE}📥 Input:{RESET}", file=out)
             if isinstance(step.action_input, dict):
                 # Pretty print JSON input
                 for key, value in step.action_input.items():
-                    val_str = str(value)
-                    if len(val_str) > 50:
-                        val_str = val_str[:50] + "..."
-                    print(f"      {Colors.DIM}{key}:{Colors.RESET} {val_str}")
+                    val_str = _shorten(str(value), 50)
+                    print(f"      {DIM}{key}:{RESET} {val_str}", file=out)
             else:
-                print(f"      {step.action_input}")
+                print(f"      {step.action_input}", file=out)
         
         if step.observation:
-            print(f"\n{Colors.YELLOW}👁️  Observation:{Colors.RESET}")
+            print(f"\n{YELLOW}👁️  Observation:{RESET}", file=out)
             # Truncate and format observation
             obs = step.observation
             if len(obs) > 400:
-                obs = obs[:400] + f"{Colors.DIM}... (truncated){Colors.RESET}"
+                obs = obs[:400] + f"{DIM}... (truncated){RESET}"
             
-            # Indent observation lines
-            for line in obs.split('\n')[:10]:  # Max 10 lines
+            # Indent observation lines (obs is already capped at 400 chars)
+            for line in islice(obs.splitlines(), 10):  # Max 10 lines
                 if line.strip():
-                    print(f"      {line[:80]}")
+                    print(f"      {line[:80]}", file=out)
     
-    print(f"\n{Colors.BOLD}{'═' * 70}{Colors.RESET}")
-    print(f"{Colors.GREEN}✓ Agent completed reasoning in {len(trace.steps)} steps{Colors.RESET}")
-    print(f"{'═' * 70}\n")
+    print(f"\n{BOLD}{HEAVY_RULE}{RESET}", file=out)
+    print(f"{GREEN}✓ Agent completed reasoning in {len(trace.steps)} steps{RESET}", file=out)
+    print(f"{HEAVY_RULE}\n", file=out)
+
+
+def print_trace(trace: AgentTrace):
+    """Pretty print the agent execution trace.
+    
+    Args:
+        trace: The execution trace to display
+    """
+    out = io.StringIO()
+    _write_trace(trace, out)
+    sys.stdout.write(out.getvalue())
 
 
 def print_header():
     """Print the CLI header."""
-    print("""
-╔══════════════════════════════════════════════════════════════╗
-║              🔌 Integration Agent CLI                        ║
-║         Configure API integrations with natural language     ║
-╚══════════════════════════════════════════════════════════════╝
-""")
+    print(HEADER_BANNER)
 
 
 def print_response(response: AgentResponse, show_trace: bool = False):
     """Pretty print an agent response.
     
+    Output is rendered into a buffer and written to stdout in one call.
+    
     Args:
         response: The AgentResponse to print
         show_trace: Whether to display the execution trace
     """
+    out = io.StringIO()
+    
     # Show trace first if available and requested
     if show_trace and response.trace:
-        print_trace(response.trace)
+        _write_trace(response.trace, out)
     
-    print("\n" + "─" * 60)
-    print(f"{Colors.BOLD}📋 AGENT RESPONSE{Colors.RESET}")
-    print("─" * 60)
+    print(f"\n{LIGHT_RULE}", file=out)
+    print(f"{BOLD}📋 AGENT RESPONSE{RESET}", file=out)
+    print(LIGHT_RULE, file=out)
     
-    print(f"\n{Colors.GREEN}🎯 Selected Action:{Colors.RESET} {Colors.BOLD}{response.selected_action}{Colors.RESET}")
+    print(f"\n{GREEN}🎯 Selected Action:{RESET} {BOLD}{response.selected_action}{RESET}", file=out)
     
-    print(f"\n{Colors.CYAN}💭 Reasoning:{Colors.RESET}")
+    print(f"\n{CYAN}💭 Reasoning:{RESET}", file=out)
     # Wrap reasoning text
-    reasoning_lines = response.reasoning.split('\n')
-    for line in reasoning_lines:
+    for line in response.reasoning.split('\n'):
         if len(line) > 70:
-            # Simple word wrap
-            words = line.split()
-            current_line = "   "
-            for word in words:
-                if len(current_line) + len(word) > 73:
-                    print(current_line)
-                    current_line = "   " + word
-                else:
-                    current_line += " " + word if current_line.strip() else "   " + word
-            if current_line.strip():
-                print(current_line)
+            print(textwrap.fill(line, width=73, initial_indent="   ", subsequent_indent="   "), file=out)
         else:
-            print(f"   {line}")
+            print(f"   {line}", file=out)
     
-    print(f"\n{Colors.BLUE}📝 Proposed Configuration (Liquid Template):{Colors.RESET}")
+    print(f"\n{BLUE}📝 Proposed Configuration (Liquid Template):{RESET}", file=out)
     
-    # Always show full config (no truncation)
-    try:
-        # Try to pretty print if it's valid JSON
-        config_parsed = json.loads(response.proposed_config.replace('{{', '__LBRACE__').replace('}}', '__RBRACE__'))
-        config_str = json.dumps(config_parsed, indent=2).replace('__LBRACE__', '{{').replace('__RBRACE__', '}}')
-        for line in config_str.split('\n'):
-            print(f"   {line}")
-    except:
-        # If not valid JSON, just print as-is
-        print(f"   {response.proposed_config}")
+    # Always show full config (no truncation). Only configs that look like
+    # JSON and aren't too large are re-indented; everything else (raw
+    # Liquid, invalid JSON) is printed as-is.
+    config_str = response.proposed_config
+    if (
+        len(config_str) <= PRETTY_CONFIG_MAX_CHARS
+        and config_str.lstrip()[:1] in ("{", "[")
+    ):
+        try:
+            # Liquid output tags inside string values are plain JSON text
+            # and round-trip unchanged
+            config_str = json.dumps(json.loads(config_str), indent=2)
+        except json.JSONDecodeError:
+            pass
+    for line in config_str.split('\n'):
+        print(f"   {line}", file=out)
     
     # Show trace summary if available but not fully displayed
     if response.trace and not show_trace:
-        print(f"\n{Colors.DIM}💡 Tip: Use --debug to see the agent's reasoning trace ({len(response.trace.steps)} steps, {len(response.trace.tool_calls)} tool calls){Colors.RESET}")
+        print(f"\n{DIM}💡 Tip: Use --debug to see the agent's reasoning trace ({len(response.trace.steps)} steps, {len(response.trace.tool_calls)} tool calls){RESET}", file=out)
     
-    print("\n" + "─" * 60)
+    print(f"\n{LIGHT_RULE}", file=out)
+    
+    sys.stdout.write(out.getvalue())
+
+
+QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
 
 
 def run_interactive(agent, debug: bool = False):
@@ -172,60 +309,74 @@ def run_interactive(agent, debug: bool = False):
         agent: IntegrationAgent instance
         debug: Enable debug mode (shows reasoning trace)
     """
-    print(f"\n{Colors.BOLD}🎤 Interactive Mode{Colors.RESET}")
+    print(f"\n{BOLD}🎤 Interactive Mode{RESET}")
     print("Type your integration request, or 'quit' to exit.")
     print("Commands: 'set <key> <value>', 'vars', 'clear', 'debug', 'quit'")
     if debug:
-        print(f"{Colors.GREEN}✓ Debug mode enabled - showing reasoning traces{Colors.RESET}")
+        print(f"{GREEN}✓ Debug mode enabled - showing reasoning traces{RESET}")
     print()
     
     variables = {}
+    vars_display = None  # Cached `vars` output, reset on every change
     show_trace = debug
     
+    # Piped input (scripts, CI fixtures) is read straight from stdin, which
+    # skips readline line editing and history
+    from_tty = sys.stdin.isatty()
+    
     while True:
         try:
-            request = input(f"{Colors.BOLD}You>{Colors.RESET} ").strip()
+            if from_tty:
+                request = input(f"{BOLD}You>{RESET} ")
+            else:
+                request = sys.stdin.readline()
+                if not request:
+                    raise EOFError
+            request = request.strip()
             
             if not request:
                 continue
             
-            if request.lower() in ('quit', 'exit', 'q'):
+            command = request.lower()
+            
+            if command in QUIT_COMMANDS:
                 print("Goodbye! 👋")
                 break
             
-            if request.lower().startswith('set '):
+            if command.startswith('set '):
                 # Set a variable
                 parts = request[4:].split(' ', 1)
                 if len(parts) == 2:
                     key, value = parts
-                    # Try to parse value as JSON
-                    try:
-                        variables[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        variables[key] = value
-                    print(f"{Colors.GREEN}✓ Set {key} = {variables[key]}{Colors.RESET}")
+                    variables[key] = _parse_value(value)
+                    vars_display = None
+                    print(f"{GREEN}✓ Set {key} = {variables[key]}{RESET}")
                 else:
                     print("Usage: set <key> <value>")
                 continue
             
-            if request.lower() == 'vars':
-                print(f"{Colors.CYAN}Current variables:{Colors.RESET}", json.dumps(variables, indent=2))
+            if command == 'vars':
+                # Re-serialize only after variables change
+                if vars_display is None:
+                    vars_display = json.dumps(variables, indent=2) if variables else "{}"
+                print(f"{CYAN}Current variables:{RESET}", vars_display)
                 continue
             
-            if request.lower() == 'clear':
+            if command == 'clear':
                 variables = {}
-                print(f"{Colors.GREEN}✓ Cleared all variables{Colors.RESET}")
+                vars_display = None
+                print(f"{GREEN}✓ Cleared all variables{RESET}")
                 continue
             
-            if request.lower() == 'debug':
+            if command == 'debug':
                 show_trace = not show_trace
                 status = "enabled" if show_trace else "disabled"
-                print(f"{Colors.GREEN}✓ Debug mode {status}{Colors.RESET}")
+                print(f"{GREEN}✓ Debug mode {status}{RESET}")
                 continue
             
-            if request.lower() == 'help':
+            if command == 'help':
                 print(f"""
-{Colors.BOLD}Available Commands:{Colors.RESET}
+{BOLD}Available Commands:{RESET}
   set <key> <value>  - Set a workflow variable
   vars               - Show current variables
   clear              - Clear all variables
@@ -233,7 +384,7 @@ def run_interactive(agent, debug: bool = False):
   help               - Show this help
   quit               - Exit interactive mode
   
-{Colors.BOLD}Example:{Colors.RESET}
+{BOLD}Example:{RESET}
   set summary "Build completed successfully"
   set slack_channel "#alerts"
   Post the summary to Slack
@@ -241,22 +392,23 @@ def run_interactive(agent, debug: bool = False):
                 continue
             
             # Run the agent
-            print(f"\n{Colors.YELLOW}⏳ Processing...{Colors.RESET}")
+            print(f"\n{YELLOW}⏳ Processing...{RESET}")
             context = {"variables": variables}
-            response = agent.run(request, context)
+            response = agent.run_streaming(request, context)
             print_response(response, show_trace=show_trace)
             print()
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nGoodbye! 👋")
             break
         except Exception as e:
-            print(f"{Colors.RED}❌ Error: {e}{Colors.RESET}")
+            print(f"{RED}❌ Error: {e}{RESET}")
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
+        prog="cli.py",
         description="Integration Agent CLI - Configure API integrations with natural language",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -264,8 +416,7 @@ Examples:
   %(prog)s "Post the summary to Slack"
   %(prog)s --context '{"summary": "test", "slack_channel": "#alerts"}' "Post to Slack"
   %(prog)s --debug -f examples/slack_message.json
-  %(prog)s --interactive
-        """
+  %(prog)s --interactive"""
     )
     
     parser.add_argument(
@@ -277,8 +428,8 @@ Examples:
     parser.add_argument(
         "-c", "--context",
         type=str,
-        default="{}",
-        help="JSON string with workflow variables (default: {})"
+        default=None,
+        help="JSON string with workflow variables (default: none)"
     )
     
     parser.add_argument(
@@ -303,7 +454,7 @@ Examples:
         "--model",
         type=str,
         default=None,
-        help=f"Override the model (default: {OPENAI_MODEL})"
+        help="Override the model (default: $OPENAI_MODEL or gpt-5)"
     )
     
     parser.add_argument(
@@ -312,19 +463,41 @@ Examples:
         help="Output response as JSON"
     )
     
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit compact JSON with --json (default when stdout is not a terminal)"
+    )
+    
     parser.add_argument(
         "--no-header",
         action="store_true",
         help="Suppress the header banner"
     )
     
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Fast path: answer bare `--help` and the no-argument case without
+    # building the argparse parser
+    argv = sys.argv[1:]
+    if not argv or argv in (["-h"], ["--help"]):
+        sys.stdout.write(HELP_TEXT)
+        if not argv:
+            print("\nError: " + MISSING_REQUEST_ERROR)
+            sys.exit(1)
+        sys.exit(0)
+    
+    parser = build_parser()
     args = parser.parse_args()
     
     # Validate we have either a request, interactive mode, or a context file
     # (context file may contain user_input)
     if not args.request and not args.interactive and not args.context_file:
         parser.print_help()
-        print("\nError: Provide a request, use --interactive mode, or provide a context file with user_input")
+        print("\nError: " + MISSING_REQUEST_ERROR)
         sys.exit(1)
     
     # Print header
@@ -332,33 +505,35 @@ Examples:
         print_header()
     
     try:
-        # Validate config
+        # Validate config (src re-exports resolve lazily, see src/__init__.py)
+        from src import validate_config
         validate_config()
         
         # Initialize vector store
         if not args.json:
             print("🔧 Initializing...")
-        initialize_vector_store()
+        from tools import warmup
+        warmup()
         
         # Import and create agent
-        from src.agent import IntegrationAgent
+        from src import IntegrationAgent
         agent = IntegrationAgent(
             model=args.model,
             verbose=args.debug
         )
         
         if not args.json:
-            print(f"{Colors.GREEN}✓ Using model: {agent.model_name}{Colors.RESET}")
+            print(f"{GREEN}✓ Using model: {agent.model_name}{RESET}")
             if args.debug:
-                print(f"{Colors.CYAN}✓ Debug mode enabled - will show reasoning trace{Colors.RESET}")
+                print(f"{CYAN}✓ Debug mode enabled - will show reasoning trace{RESET}")
         
         if args.interactive:
             run_interactive(agent, debug=args.debug)
         else:
             # Parse context
             if args.context_file:
-                with open(args.context_file) as f:
-                    context_data = json.load(f)
+                with open(args.context_file, "rb") as f:
+                    context_data = _loads(f.read())
                     # Support both formats:
                     # 1. Standard format: {"user_input": "...", "variables": {...}}
                     # 2. Direct variables: {...} (backward compatible)
@@ -370,8 +545,10 @@ Examples:
                     else:
                         # Legacy format: entire JSON is variables
                         variables = context_data
+            elif args.context is not None:
+                variables = _loads(args.context)
             else:
-                variables = json.loads(args.context)
+                variables = {}
             
             # Final validation: ensure we have a request
             if not args.request:
@@ -381,29 +558,18 @@ Examples:
             context = {"variables": variables}
             
             if not args.json:
-                print(f"{Colors.BLUE}📨 Request:{Colors.RESET} {args.request}")
+                print(f"{BLUE}📨 Request:{RESET} {args.request}")
                 if variables:
-                    print(f"{Colors.BLUE}📎 Variables:{Colors.RESET} {list(variables.keys())}")
-                print(f"\n{Colors.YELLOW}⏳ Processing...{Colors.RESET}\n")
+                    print(f"{BLUE}📎 Variables:{RESET} {list(variables.keys())}")
+                print(f"\n{YELLOW}⏳ Processing...{RESET}\n")
             
             # Run the agent
-            response = agent.run(args.request, context)
+            response = agent.run_streaming(args.request, context)
             
             if args.json:
                 # Output as JSON
-                output = {
-                    "selected_action": response.selected_action,
-                    "reasoning": response.reasoning,
-                    "proposed_config": response.proposed_config
-                }
-                # Include trace if available
-                if response.trace:
-                    output["trace"] = {
-                        "steps": [s.model_dump() for s in response.trace.steps],
-                        "tool_calls": [t.model_dump() for t in response.trace.tool_calls],
-                        "total_duration_ms": response.trace.total_duration_ms
-                    }
-                print(json.dumps(output, indent=2))
+                pretty = not args.compact and sys.stdout.isatty()
+                sys.stdout.write(_response_json(response, pretty=pretty) + "\n")
             else:
                 print_response(response, show_trace=args.debug)
             
@@ -8,6 +8,20 @@ Usage:
 import json
 import sys
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
+# (label, metrics key, format spec, unit) for each summary table row
+METRIC_ROWS = (
+    ("Action Accuracy", "action_accuracy", ".1f", "%"),
+    ("Liquid Valid", "liquid_valid", ".1f", "%"),
+    ("Renders to JSON", "renders_to_json", ".1f", "%"),
+    ("Avg Latency", "avg_latency_ms", ".0f", "ms"),
+    ("Error Rate", "error_rate", ".1f", "%"),
+)
+
 
 def main():
     if len(sys.argv) < 2:
@@ -17,8 +31,9 @@ def main():
     result_file = sys.argv[1]
     
     try:
-        with open(result_file) as f:
-            data = json.load(f)
+        with open(result_file, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error reading {result_file}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -27,13 +42,11 @@ def main():
     prompt_hash = data.get("prompt_hash", "unknown")
     
     # Output metrics table rows
-    print(f"| Action Accuracy | {metrics.get('action_accuracy', 0):.1f}% |")
-    print(f"| Liquid Valid | {metrics.get('liquid_valid', 0):.1f}% |")
-    print(f"| Renders to JSON | {metrics.get('renders_to_json', 0):.1f}% |")
-    print(f"| Avg Latency | {metrics.get('avg_latency_ms', 0):.0f}ms |")
-    print(f"| Error Rate | {metrics.get('error_rate', 0):.1f}% |")
-    print()
-    print(f"Prompt Hash: `{prompt_hash}`")
+    rows = "\n".join(
+        f"| {label} | {metrics.get(key, 0):{fmt}}{unit} |"
+        for label, key, fmt, unit in METRIC_ROWS
+    )
+    sys.stdout.write(f"{rows}\n\nPrompt Hash: `{prompt_hash}`\n")
 
 
 if __name__ == "__main__":
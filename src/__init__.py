@@ -1 +1,47 @@
-"""Integration Agent - Core source module."""
+"""Integration Agent - Core source module.
+
+Public symbols are re-exported lazily (PEP 562) so that importing ``src``
+does not pull in LangChain, ChromaDB, or the OpenAI SDK until a symbol
+that needs them is actually accessed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.agent import IntegrationAgent, create_integration_agent, run_agent
+    from src.config import OPENAI_MODEL, validate_config
+    from src.models import AgentResponse, AgentTrace, WorkflowContext
+    from src.vector_store import VectorStore, get_vector_store, initialize_vector_store
+
+
+# Maps exported name -> module that defines it
+_LAZY_IMPORTS = {
+    "IntegrationAgent": "src.agent",
+    "create_integration_agent": "src.agent",
+    "run_agent": "src.agent",
+    "OPENAI_MODEL": "src.config",
+    "validate_config": "src.config",
+    "AgentResponse": "src.models",
+    "AgentTrace": "src.models",
+    "WorkflowContext": "src.models",
+    "VectorStore": "src.vector_store",
+    "get_vector_store": "src.vector_store",
+    "initialize_vector_store": "src.vector_store",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Import a re-exported symbol on first access and cache it."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
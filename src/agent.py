@@ -7,20 +7,123 @@ This module implements the core Integration Agent that:
 4. Generates Liquid-templated configurations with DETERMINISTIC structured output
 """
 
-import json
+import asyncio
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
 
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import SystemMessage, HumanMessage
 from langgraph.prebuilt import create_react_agent
 
-from src.config import OPENAI_API_KEY, OPENAI_MODEL, AGENT_VERBOSE, validate_config
+from src.config import OPENAI_API_KEY, OPENAI_MODEL, OPENAI_PROMPT_CACHE_KEY, OPENAI_SEED, AGENT_VERBOSE, validate_config
 from src.models import AgentResponse, AgentResponseOutput, WorkflowContext, AgentTrace, ThoughtStep, ToolCall
+from src.response_parser import StreamingResponseParser, parse_response
 from src.prompt_loader import load_system_prompt, load_user_request_prompt, load_structured_response_prompt
 from tools import AGENT_TOOLS
 
 
+# OpenAI structured-outputs format for the ReAct agent's final answer
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "agent_response",
+        "strict": True,
+        "schema": {**AgentResponseOutput.model_json_schema(), "additionalProperties": False},
+    },
+}
+
+
+# Most recent responses kept per agent for repeated identical requests
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cap text at limit characters, marking the cut with an ellipsis.
+    
+    Returns the original string unchanged (no copy) when it already fits.
+    """
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+# Trace thoughts for tools whose wording doesn't depend on their arguments
+_STATIC_THOUGHTS = {
+    "get_available_actions": "I need to see what integration actions are available to handle this request.",
+}
+
+
+@lru_cache(maxsize=8)
+def _get_llm(model: str, temperature: float, api_key: Optional[str]) -> ChatOpenAI:
+    """Get a shared ChatOpenAI client for the given settings.
+    
+    Agents created with the same settings reuse one client (and its HTTP
+    connection pool) instead of constructing a new one per instance.
+    
+    Requests carry a prompt_cache_key so OpenAI routes them to servers that
+    already hold the static system prompt prefix in their prompt cache, and
+    a fixed seed so repeated identical requests sample the same completion.
+    """
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        seed=OPENAI_SEED,
+        api_key=api_key,
+        model_kwargs={"prompt_cache_key": OPENAI_PROMPT_CACHE_KEY}
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_structured_llm(model: str, temperature: float, api_key: Optional[str]):
+    """Get the shared structured-output runnable for the given settings.
+    
+    Converting AgentResponseOutput to a JSON schema and wrapping the client
+    happens once per settings rather than per agent. Strict json_schema mode
+    has OpenAI constrain decoding to the schema, so the fallback call never
+    returns malformed output that needs a retry.
+    """
+    return _get_llm(model, temperature, api_key).with_structured_output(
+        AgentResponseOutput,
+        method="json_schema",
+        strict=True
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_react_agent(model: str, temperature: float, api_key: Optional[str]):
+    """Get a compiled ReAct graph shared by agents with the same settings.
+    
+    Compiling the LangGraph state machine is the most expensive part of
+    constructing an agent. The compiled graph holds no per-run state (there
+    is no checkpointer), so one graph can serve every agent and concurrent
+    runs.
+    """
+    # Bind the tools together with a strict JSON-schema response format:
+    # the model can still call tools, but its final answer is constrained
+    # to AgentResponseOutput, so parse_response reads it directly and the
+    # second structured-LLM call is only a fallback.
+    # parallel_tool_calls lets the model request independent lookups in
+    # one turn; LangGraph's ToolNode then runs them concurrently. The cost:
+    # OpenAI doesn't guarantee strict schema adherence with parallel tool
+    # calls on, so the final answer may not match AgentResponseOutput.
+    # parse_response rejects such answers and _respond falls back to the
+    # structured LLM, which is strict on its own.
+    bound_llm = _get_llm(model, temperature, api_key).bind_tools(
+        AGENT_TOOLS,
+        parallel_tool_calls=True,
+        response_format=_RESPONSE_FORMAT
+    )
+    
+    # Create the ReAct agent using LangGraph for tool calling
+    return create_react_agent(
+        model=bound_llm,
+        tools=AGENT_TOOLS
+    )
+
+
 class IntegrationAgent:
     """Integration Agent that configures API integrations based on natural language.
     
@@ -35,8 +138,9 @@ class IntegrationAgent:
     def __init__(
         self, 
         model: Optional[str] = None,
-        temperature: float = 0.2,
-        verbose: bool = False
+        temperature: float = 0.0,
+        verbose: bool = False,
+        cache_responses: bool = False
     ):
         """Initialize the Integration Agent.
         
@@ -44,22 +148,31 @@ class IntegrationAgent:
             model: OpenAI model name (defaults to config OPENAI_MODEL)
             temperature: Model temperature (lower = more deterministic)
             verbose: Enable verbose logging of agent steps
+            cache_responses: Reuse the response to an identical earlier
+                request instead of calling the LLM again (off by default,
+                so evals and retries always reach the model)
         """
         validate_config()
         
         self.model_name = model or OPENAI_MODEL
         self.temperature = temperature
         self.verbose = verbose or AGENT_VERBOSE
+        self.cache_responses = cache_responses
         
-        # Initialize the LLM
-        self.llm = ChatOpenAI(
-            model=self.model_name,
-            temperature=self.temperature,
-            api_key=OPENAI_API_KEY
-        )
+        # Initialize the LLM (shared across agents with the same settings)
+        self.llm = _get_llm(self.model_name, self.temperature, OPENAI_API_KEY)
         
         # Create LLM with structured output for final response generation
-        self.structured_llm = self.llm.with_structured_output(AgentResponseOutput)
+        self.structured_llm = _get_structured_llm(self.model_name, self.temperature, OPENAI_API_KEY)
+        
+        # The system prompt is static, so one message is shared by every run
+        self._system_message = SystemMessage(content=load_system_prompt())
+        
+        # Completed responses keyed by rendered user prompt, least recent first.
+        # Kept per agent so responses never cross agent instances.
+        self._response_cache: OrderedDict[str, AgentResponse] = OrderedDict()
+        # Guards _response_cache: an agent may serve several threads at once
+        self._response_cache_lock = threading.Lock()
         
         # Initialize tools
         self.tools = AGENT_TOOLS
@@ -69,11 +182,8 @@ class IntegrationAgent:
     
     def _setup_agent(self):
         """Set up the LangGraph ReAct agent with tools."""
-        # Create the ReAct agent using LangGraph for tool calling
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools
-        )
+        # Compiled graphs are shared across agents with the same settings
+        self.agent = _get_react_agent(self.model_name, self.temperature, OPENAI_API_KEY)
     
     def _format_user_input(self, request: str, variables: dict) -> str:
         """Format the user input with workflow context.
@@ -100,11 +210,8 @@ class IntegrationAgent:
         Returns:
             AgentTrace with steps and tool calls
         """
-        trace = AgentTrace(
-            total_duration_ms=total_duration_ms,
-            model_name=self.model_name
-        )
-        
+        # Trace data comes from our own typed code and is only used for
+        # display, so models are built with model_construct to skip validation
         steps = []
         tool_calls_list = []
         step_number = 1
@@ -113,24 +220,28 @@ class IntegrationAgent:
         pending_tool_calls = {}
         
         for msg in messages:
-            # Skip system and human messages (they're the input)
-            if isinstance(msg, (SystemMessage, HumanMessage)):
-                continue
+            # Dispatch on LangChain's message type tag ("system", "human",
+            # "ai", "tool") rather than an isinstance chain. System and human
+            # messages are the input and fall through untouched.
+            msg_type = msg.type
+            
+            # The type tag fixes the message class, so AIMessage/ToolMessage
+            # attributes are read directly rather than probed with getattr
             
             # AI Message - contains thoughts and tool call decisions
-            if isinstance(msg, AIMessage):
+            if msg_type == "ai":
                 content = msg.content if msg.content else ""
-                tool_calls = getattr(msg, 'tool_calls', []) or []
+                tool_calls = msg.tool_calls or []
                 
                 # If there's content before tool calls, it's a thought
                 if content and not tool_calls:
                     # This is a final response (no more tool calls)
-                    steps.append(ThoughtStep(
+                    steps.append(ThoughtStep.model_construct(
                         step_number=step_number,
                         thought="Generating final response",
                         action="Final Answer",
                         action_input=None,
-                        observation=content[:200] + "..." if len(content) > 200 else content
+                        observation=_truncate(content, 200)
                     ))
                     step_number += 1
                 
@@ -143,7 +254,7 @@ class IntegrationAgent:
                     # Create a thought step for the tool call
                     thought = self._infer_thought(tool_name, tool_args)
                     
-                    step = ThoughtStep(
+                    step = ThoughtStep.model_construct(
                         step_number=step_number,
                         thought=thought,
                         action=f"Call tool: {tool_name}",
@@ -151,35 +262,38 @@ class IntegrationAgent:
                         observation=None  # Will be filled in by ToolMessage
                     )
                     steps.append(step)
-                    pending_tool_calls[tool_id] = (step, len(steps) - 1)
+                    pending_tool_calls[tool_id] = step
                     step_number += 1
             
             # Tool Message - contains tool output/observation
-            elif isinstance(msg, ToolMessage):
-                tool_id = getattr(msg, 'tool_call_id', '')
-                tool_name = getattr(msg, 'name', 'unknown')
+            elif msg_type == "tool":
+                tool_id = msg.tool_call_id
+                tool_name = msg.name or 'unknown'
                 content = msg.content if msg.content else ""
                 
-                # Truncate very long tool outputs for readability
-                truncated_content = content[:500] + "..." if len(content) > 500 else content
+                # Truncate very long tool outputs once; the step and the
+                # tool call record share the same string
+                truncated_content = _truncate(content, 500)
                 
-                # Match with pending tool call
-                if tool_id in pending_tool_calls:
-                    step, idx = pending_tool_calls[tool_id]
-                    steps[idx].observation = truncated_content
+                # Match with pending tool call; each call gets one result
+                step = pending_tool_calls.pop(tool_id, None)
+                if step is not None:
+                    step.observation = truncated_content
                 
                 # Also record as a tool call
-                tool_calls_list.append(ToolCall(
+                tool_calls_list.append(ToolCall.model_construct(
                     tool_name=tool_name,
-                    tool_input=pending_tool_calls.get(tool_id, ({}, 0))[0].action_input or {},
+                    tool_input=(step.action_input if step is not None else None) or {},
                     tool_output=truncated_content,
-                    duration_ms=0  # We don't have per-tool timing
+                    duration_ms=0.0  # We don't have per-tool timing
                 ))
         
-        trace.steps = steps
-        trace.tool_calls = tool_calls_list
-        
-        return trace
+        return AgentTrace.model_construct(
+            steps=steps,
+            tool_calls=tool_calls_list,
+            total_duration_ms=total_duration_ms,
+            model_name=self.model_name
+        )
     
     def _infer_thought(self, tool_name: str, tool_args: dict) -> str:
         """Infer the agent's reasoning based on which tool it called.
@@ -191,9 +305,10 @@ class IntegrationAgent:
         Returns:
             Human-readable thought/reasoning
         """
-        if tool_name == "get_available_actions":
-            return "I need to see what integration actions are available to handle this request."
-        elif tool_name == "retrieve_api_documentation":
+        thought = _STATIC_THOUGHTS.get(tool_name)
+        if thought is not None:
+            return thought
+        if tool_name == "retrieve_api_documentation":
             action_id = tool_args.get('action_id', 'the selected action')
             return f"Now I need to retrieve the API documentation for '{action_id}' to understand the required payload structure."
         elif tool_name == "search_actions":
@@ -218,80 +333,404 @@ class IntegrationAgent:
         prompt = load_structured_response_prompt(agent_output, request, variables)
         return self.structured_llm.invoke(prompt)
     
-    def run(self, request: str, context: dict) -> AgentResponse:
+    async def _agenerate_structured_response(self, agent_output: str, request: str, variables: dict) -> AgentResponseOutput:
+        """Async version of _generate_structured_response()."""
+        prompt = load_structured_response_prompt(agent_output, request, variables)
+        return await self.structured_llm.ainvoke(prompt)
+    
+    def _build_messages(self, request: str, variables: dict) -> list:
+        """Build the input message list for the ReAct agent.
+        
+        Args:
+            request: User's natural language request
+            variables: Workflow variables
+            
+        Returns:
+            List with the system prompt and formatted user input
+        """
+        # The static system prompt comes first so it forms a cacheable prefix;
+        # everything request-specific (including variables) follows it
+        return [
+            self._system_message,
+            HumanMessage(content=load_user_request_prompt(request, variables))
+        ]
+    
+    def _process_agent_result(self, result: dict, duration_ms: float) -> tuple[Optional[AgentTrace], str]:
+        """Extract the optional trace and final text output from a ReAct run.
+        
+        Args:
+            result: State returned by the ReAct agent
+            duration_ms: Time spent in the ReAct agent
+            
+        Returns:
+            Tuple of (trace or None, final agent output text)
+        """
+        # Extract the final message content
+        final_messages = result.get("messages", [])
+        
+        # Extract trace if verbose mode is enabled
+        trace = None
+        if self.verbose and final_messages:
+            trace = self._extract_trace(final_messages, duration_ms)
+            # Note: Trace printing is handled by CLI, not by the agent
+        
+        # Get the final AI response. The last message is almost always it;
+        # only scan back when it is empty (e.g. a trailing tool message)
+        agent_output = final_messages[-1].content if final_messages else ""
+        if not agent_output:
+            for msg in reversed(final_messages):
+                if msg.content:
+                    agent_output = msg.content
+                    break
+        
+        return trace, agent_output
+    
+    def _cached_response(self, key: str) -> Optional[AgentResponse]:
+        """Return a copy of the cached response for a rendered user prompt, if any.
+        
+        Always None unless the agent was created with cache_responses=True.
+        Callers get their own copy, so changing a response never affects
+        later hits. In verbose mode a hit carries a fresh trace of the
+        lookup itself, marked as a cache hit, rather than the original run's.
+        """
+        if not self.cache_responses:
+            return None
+        start_time = time.perf_counter()
+        with self._response_cache_lock:
+            response = self._response_cache.get(key)
+            if response is None:
+                return None
+            self._response_cache.move_to_end(key)
+        response = response.model_copy(deep=True)
+        if self.verbose:
+            response.trace = AgentTrace.model_construct(
+                steps=[ThoughtStep.model_construct(
+                    step_number=1,
+                    thought="This request matches an earlier one, so its response is reused.",
+                    action="Response cache hit",
+                    action_input=None,
+                    observation=None
+                )],
+                tool_calls=[],
+                total_duration_ms=(time.perf_counter() - start_time) * 1000,
+                model_name=self.model_name
+            )
+        return response
+    
+    def _cache_response(self, key: str, response: AgentResponse) -> None:
+        """Remember a copy of a successful response, evicting the least recently used.
+        
+        The stored copy drops the trace, which only describes the run that
+        produced it. Does nothing unless cache_responses is enabled.
+        """
+        if not self.cache_responses or response.selected_action == "error":
+            return
+        response = response.model_copy(update={"trace": None}, deep=True)
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    @staticmethod
+    def _build_response(structured_output: AgentResponseOutput, trace: Optional[AgentTrace]) -> AgentResponse:
+        """Wrap structured LLM output (plus optional trace) as an AgentResponse.
+        
+        The fields were already validated as AgentResponseOutput, so the
+        response is assembled with model_construct instead of re-validating.
+        """
+        return AgentResponse.model_construct(
+            selected_action=structured_output.selected_action,
+            reasoning=structured_output.reasoning,
+            proposed_config=structured_output.proposed_config,
+            trace=trace
+        )
+    
+    @staticmethod
+    def _error_response(error: Exception, trace: Optional[AgentTrace]) -> AgentResponse:
+        """Fallback response for structured output errors."""
+        return AgentResponse.model_construct(
+            selected_action="error",
+            reasoning=f"Structured output generation failed: {str(error)}",
+            proposed_config="{}",
+            trace=trace
+        )
+    
+    def run(self, request: str, context: dict, bypass_cache: bool = False) -> AgentResponse:
         """Run the agent to process a user request.
         
         Uses ReAct pattern for tool calling, then structured output for
-        deterministic final response generation.
+        deterministic final response generation. With cache_responses
+        enabled, a request repeated with the same variables returns this
+        agent's earlier response without calling the LLM.
+        
+        Args:
+            request: User's natural language request
+            context: Workflow context dict with 'user_input' and 'variables' keys
+            bypass_cache: Always run the agent, ignoring earlier responses
+            
+        Returns:
+            AgentResponse with selected_action, reasoning, proposed_config, and optional trace
+        """
+        return self._run(request, context.get("variables", {}), bypass_cache)
+    
+    def _run(self, request: str, variables: dict, bypass_cache: bool = False) -> AgentResponse:
+        """Run the agent on a request with its workflow variables.
+        
+        Shared by run() and run_with_workflow_context(), which only differ
+        in where the variables come from.
+        
+        Args:
+            request: User's natural language request
+            variables: Workflow variables
+            bypass_cache: Always run the agent, ignoring earlier responses
+            
+        Returns:
+            AgentResponse with selected_action, reasoning, proposed_config, and optional trace
+        """
+        messages = self._build_messages(request, variables)
+        
+        # The rendered user prompt identifies the request and its variables
+        # (the system prompt is static), so it doubles as the cache key
+        cache_key = messages[-1].content
+        if not bypass_cache:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Run the ReAct agent for tool calling, tracking execution time
+        start_time = time.perf_counter()
+        result = self.agent.invoke({"messages": messages})
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        
+        response = self._respond(result, duration_ms, request, variables)
+        self._cache_response(cache_key, response)
+        return response
+    
+    def _respond(self, result: dict, duration_ms: float, request: str, variables: dict) -> AgentResponse:
+        """Turn a finished ReAct run into an AgentResponse.
+        
+        Args:
+            result: State returned by the ReAct agent
+            duration_ms: Time spent in the ReAct agent
+            request: User's natural language request
+            variables: Workflow variables
+            
+        Returns:
+            AgentResponse with selected_action, reasoning, proposed_config, and optional trace
+        """
+        trace, agent_output = self._process_agent_result(result, duration_ms)
+        
+        # Use the agent's own JSON answer when valid, otherwise fall back to
+        # the structured LLM to generate a deterministic response
+        try:
+            structured_output = parse_response(agent_output)
+            if structured_output is None:
+                structured_output = self._generate_structured_response(agent_output, request, variables)
+            return self._build_response(structured_output, trace)
+        except Exception as e:
+            return self._error_response(e, trace)
+    
+    def run_streaming(self, request: str, context: dict, bypass_cache: bool = False) -> AgentResponse:
+        """Run the agent, returning as soon as its JSON answer has streamed in.
+        
+        Streams the ReAct agent's messages and parses the current AI message
+        whenever its braces balance, so the response is available before the
+        model finishes emitting trailing text. Falls back to the same path
+        as run() when no valid answer is streamed. Verbose mode always uses
+        run(), because the trace needs the complete message history. Shares
+        run()'s response cache when cache_responses is enabled.
         
         Args:
             request: User's natural language request
             context: Workflow context dict with 'user_input' and 'variables' keys
+            bypass_cache: Always run the agent, ignoring earlier responses
             
         Returns:
             AgentResponse with selected_action, reasoning, proposed_config, and optional trace
         """
-        # Extract variables from context
+        if self.verbose:
+            return self.run(request, context, bypass_cache)
+        
         variables = context.get("variables", {})
+        messages = self._build_messages(request, variables)
         
-        # Load system prompt with variables
-        system_prompt = load_system_prompt(variables)
+        cache_key = messages[-1].content
+        if not bypass_cache:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
         
-        # Format user input
-        user_input = self._format_user_input(request, variables)
+        start_time = time.perf_counter()
+        final_state = {}
+        parser = StreamingResponseParser()
+        for mode, payload in self.agent.stream({"messages": messages}, stream_mode=["messages", "values"]):
+            if mode == "values":
+                final_state = payload
+                continue
+            
+            chunk, _metadata = payload
+            if chunk.type == "tool":
+                continue
+            structured_output = parser.feed(chunk.id, chunk.content)
+            if structured_output is not None:
+                response = self._build_response(structured_output, None)
+                break
+        else:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            response = self._respond(final_state, duration_ms, request, variables)
         
-        # Build messages
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_input)
-        ]
+        self._cache_response(cache_key, response)
+        return response
+    
+    async def arun_streaming(self, request: str, context: dict, bypass_cache: bool = False) -> AgentResponse:
+        """Async version of run_streaming().
+        
+        Args:
+            request: User's natural language request
+            context: Workflow context dict with 'user_input' and 'variables' keys
+            bypass_cache: Always run the agent, ignoring earlier responses
+            
+        Returns:
+            AgentResponse with selected_action, reasoning, proposed_config, and optional trace
+        """
+        if self.verbose:
+            return await self.arun(request, context, bypass_cache)
+        
+        variables = context.get("variables", {})
+        messages = self._build_messages(request, variables)
+        
+        cache_key = messages[-1].content
+        if not bypass_cache:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
         
-        # Track execution time
         start_time = time.perf_counter()
+        final_state = {}
+        parser = StreamingResponseParser()
+        async for mode, payload in self.agent.astream({"messages": messages}, stream_mode=["messages", "values"]):
+            if mode == "values":
+                final_state = payload
+                continue
+            
+            chunk, _metadata = payload
+            if chunk.type == "tool":
+                continue
+            structured_output = parser.feed(chunk.id, chunk.content)
+            if structured_output is not None:
+                response = self._build_response(structured_output, None)
+                break
+        else:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            response = await self._arespond(final_state, duration_ms, request, variables)
         
-        # Run the ReAct agent for tool calling
-        result = self.agent.invoke({"messages": messages})
+        self._cache_response(cache_key, response)
+        return response
+    
+    async def arun(self, request: str, context: dict, bypass_cache: bool = False) -> AgentResponse:
+        """Async version of run().
         
-        # Calculate duration
-        end_time = time.perf_counter()
-        duration_ms = (end_time - start_time) * 1000
+        Uses the async LangGraph/LangChain entry points so several requests
+        can be in flight at once (see run_batch).
         
-        # Extract the final message content
-        final_messages = result.get("messages", [])
+        Args:
+            request: User's natural language request
+            context: Workflow context dict with 'user_input' and 'variables' keys
+            bypass_cache: Always run the agent, ignoring earlier responses
+            
+        Returns:
+            AgentResponse with selected_action, reasoning, proposed_config, and optional trace
+        """
+        variables = context.get("variables", {})
+        messages = self._build_messages(request, variables)
         
-        # Extract trace if verbose mode is enabled
-        trace = None
-        if self.verbose and final_messages:
-            trace = self._extract_trace(final_messages, duration_ms)
-            # Note: Trace printing is handled by CLI, not by the agent
+        cache_key = messages[-1].content
+        if not bypass_cache:
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
         
-        # Get the final AI response
-        agent_output = ""
-        if final_messages:
-            for msg in reversed(final_messages):
-                if hasattr(msg, "content") and msg.content:
-                    agent_output = msg.content
-                    break
+        start_time = time.perf_counter()
+        result = await self.agent.ainvoke({"messages": messages})
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        
+        response = await self._arespond(result, duration_ms, request, variables)
+        self._cache_response(cache_key, response)
+        return response
+    
+    async def _arespond(self, result: dict, duration_ms: float, request: str, variables: dict) -> AgentResponse:
+        """Async version of _respond()."""
+        trace, agent_output = self._process_agent_result(result, duration_ms)
         
-        # Use structured LLM to generate deterministic response
         try:
-            structured_output = self._generate_structured_response(agent_output, request, variables)
-            response = AgentResponse(
-                selected_action=structured_output.selected_action,
-                reasoning=structured_output.reasoning,
-                proposed_config=structured_output.proposed_config,
-                trace=trace
-            )
+            structured_output = parse_response(agent_output)
+            if structured_output is None:
+                structured_output = await self._agenerate_structured_response(agent_output, request, variables)
+            return self._build_response(structured_output, trace)
         except Exception as e:
-            # Fallback for any structured output errors
-            response = AgentResponse(
-                selected_action="error",
-                reasoning=f"Structured output generation failed: {str(e)}",
-                proposed_config="{}",
-                trace=trace
-            )
+            return self._error_response(e, trace)
+    
+    async def arun_batch(
+        self,
+        items: list[tuple[str, dict]],
+        batch_size: int = 5,
+        delay: float = 0.0
+    ) -> list[AgentResponse]:
+        """Run several independent requests concurrently, in batches.
+        
+        Each batch of up to batch_size requests runs concurrently; batches
+        run one after another with an optional pause in between, to stay
+        under provider rate limits.
         
-        return response
+        Args:
+            items: List of (request, context) pairs
+            batch_size: Maximum number of requests in flight at once
+            delay: Seconds to wait between batches
+            
+        Returns:
+            AgentResponses in the same order as items
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        responses = []
+        for start in range(0, len(items), batch_size):
+            if start and delay:
+                await asyncio.sleep(delay)
+            batch = items[start:start + batch_size]
+            responses.extend(await asyncio.gather(*(self.arun(request, context) for request, context in batch)))
+        return responses
+    
+    def run_batch(
+        self,
+        items: list[tuple[str, dict]],
+        batch_size: int = 5,
+        delay: float = 0.0
+    ) -> list[AgentResponse]:
+        """Synchronous wrapper around arun_batch().
+        
+        Total wall time is roughly that of the slowest request per batch
+        rather than the sum of all of them.
+        
+        Args:
+            items: List of (request, context) pairs
+            batch_size: Maximum number of requests in flight at once
+            delay: Seconds to wait between batches
+            
+        Returns:
+            AgentResponses in the same order as items
+            
+        Raises:
+            RuntimeError: If called from inside a running event loop (await
+                arun_batch() there instead)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.arun_batch(items, batch_size=batch_size, delay=delay))
+        raise RuntimeError(
+            "run_batch() cannot be called from a running event loop; await arun_batch() instead"
+        )
     
     def run_with_workflow_context(self, workflow_context: WorkflowContext) -> AgentResponse:
         """Run the agent with a WorkflowContext object.
@@ -302,17 +741,14 @@ class IntegrationAgent:
         Returns:
             AgentResponse with selected_action, reasoning, and proposed_config
         """
-        context = {
-            "user_input": workflow_context.user_input,
-            "variables": workflow_context.variables
-        }
-        return self.run(workflow_context.user_input, context)
+        return self._run(workflow_context.user_input, workflow_context.variables)
 
 
 def create_integration_agent(
     model: Optional[str] = None,
-    temperature: float = 0.2,
-    verbose: bool = False
+    temperature: float = 0.0,
+    verbose: bool = False,
+    cache_responses: bool = False
 ) -> IntegrationAgent:
     """Factory function to create an IntegrationAgent.
     
@@ -320,6 +756,7 @@ def create_integration_agent(
         model: OpenAI model name
         temperature: Model temperature
         verbose: Enable verbose logging
+        cache_responses: Reuse responses to identical earlier requests
         
     Returns:
         Configured IntegrationAgent instance
@@ -327,7 +764,8 @@ def create_integration_agent(
     return IntegrationAgent(
         model=model,
         temperature=temperature,
-        verbose=verbose
+        verbose=verbose,
+        cache_responses=cache_responses
     )
 
 
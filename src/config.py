@@ -1,12 +1,35 @@
 """Configuration and environment variable loading."""
 
 import os
+import warnings
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+
+def _int_env(name: str, default: int) -> Optional[int]:
+    """Read an integer setting from the environment.
+    
+    An unset variable gives the default and an empty one gives None (the
+    setting is turned off). A value that isn't an integer also gives the
+    default, with a warning, so a typo can't break every import of src.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn(f"{name}={value!r} is not an integer; using {default}")
+        return default
+
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -14,21 +37,29 @@ API_DOCS_DIR = DATA_DIR / "api_docs"
 PROMPTS_DIR = PROJECT_ROOT / "prompts"
 DB_DIR = PROJECT_ROOT / "db"
 CHROMA_DIR = DB_DIR / "chroma"
+JINJA_CACHE_DIR = DB_DIR / "jinja_cache"
 RESULTS_DIR = PROJECT_ROOT / "results"
 
-# Ensure directories exist
-for dir_path in [API_DOCS_DIR, PROMPTS_DIR, CHROMA_DIR, RESULTS_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+# Directories are created where they are written (vector store persistence,
+# template bytecode, eval results), not at import time
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-5")  # Default to GPT-5
+# Routes requests that share the static system prompt to cache-warm servers
+OPENAI_PROMPT_CACHE_KEY = os.getenv("OPENAI_PROMPT_CACHE_KEY", "integration-agent")
+# Fixed sampling seed so identical prompts give reproducible completions;
+# set OPENAI_SEED to an empty value to send no seed
+OPENAI_SEED = _int_env("OPENAI_SEED", 42)
 
 # ChromaDB Configuration
 CHROMA_COLLECTION_NAME = "api_docs"
 
 # Embedding Configuration
 EMBEDDING_MODEL = "text-embedding-3-small"
+# text-embedding-3 models can return shortened vectors with little loss in
+# retrieval quality; 512 dims is a third of the default 1536's memory and disk
+EMBEDDING_DIMENSIONS = 512
 
 # Agent Configuration
 AGENT_VERBOSE = os.getenv("AGENT_VERBOSE", "false").lower() == "true"
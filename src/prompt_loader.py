@@ -4,42 +4,130 @@ This module handles loading and rendering Jinja2 prompt templates
 from the prompts/ directory.
 """
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+from jinja2.bccache import Bucket
 
-from src.config import PROMPTS_DIR
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
+from src.config import JINJA_CACHE_DIR, PROMPTS_DIR
 
-# Initialize Jinja2 environment
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that creates its directory on the first write.
+    
+    Compiled templates are persisted so new processes (CLI runs, eval jobs)
+    skip re-parsing the .j2 sources, without importing this module touching
+    the filesystem. Reads of a missing directory are plain cache misses.
+    """
+    
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+
+# Initialize Jinja2 environment. Prompts are static for the life of the
+# process, so auto_reload is off and templates aren't re-stat'ed on load.
 _env = Environment(
     loader=FileSystemLoader(PROMPTS_DIR),
+    bytecode_cache=_LazyBytecodeCache(str(JINJA_CACHE_DIR), "%s.cache"),
+    auto_reload=False,
     autoescape=select_autoescape(default=False),
     trim_blocks=True,
     lstrip_blocks=True
 )
 
 
-def load_system_prompt(variables: dict) -> str:
-    """Load and render the system prompt with workflow variables.
+@lru_cache(maxsize=32)
+def _get_template(name: str) -> Template:
+    """Get a compiled template, skipping Jinja's per-call loader/mtime checks.
+    
+    Templates are treated as static for the life of the process; call
+    ``_get_template.cache_clear()`` to pick up edits.
+    """
+    return _env.get_template(name)
+
+
+def _variables_key(variables: dict) -> str | bytes:
+    """Serialize variables into a hashable cache key.
+    
+    Key order is preserved (not sorted) because the templates iterate
+    variables in insertion order. The prompt is rendered from the decoded
+    key, so it must keep everything the templates' ``tojson`` output depends
+    on. Uses orjson (bytes) when available and falls back to stdlib json for
+    input orjson can't encode faithfully: non-string keys, integers beyond
+    64 bits, and NaN or infinities, which orjson would write as ``null``.
+    The key is never shown, so its formatting doesn't matter.
+    """
+    if orjson is not None:
+        try:
+            key = orjson.dumps(
+                variables,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+            )
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            pass
+        else:
+            # A null may stand for NaN or an infinity; only stdlib keeps those
+            if b"null" not in key:
+                return key
+    return json.dumps(variables)
+
+
+def _loads_variables(variables_json: str | bytes) -> dict:
+    """Inverse of _variables_key; str keys came from the stdlib fallback."""
+    if isinstance(variables_json, bytes):
+        return orjson.loads(variables_json)
+    return json.loads(variables_json)
+
+
+@lru_cache(maxsize=256)
+def _render_user_request_prompt(request: str, variables_json: str | bytes) -> str:
+    template = _get_template("user_request.j2")
+    return template.render(request=request, variables=_loads_variables(variables_json))
+
+
+@lru_cache(maxsize=1)
+def load_system_prompt() -> str:
+    """Load and render the system prompt.
+    
+    The system prompt is static: per-request variables go in the user
+    request prompt instead. Every run therefore shares an identical prompt
+    prefix, which lets the provider's automatic prompt caching reuse it.
+    The rendered prompt is memoized.
     
-    Args:
-        variables: Workflow context variables dict
-        
     Returns:
         Rendered system prompt string
     """
-    template = _env.get_template("system_prompt.j2")
-    return template.render(variables=variables)
+    template = _get_template("system_prompt.j2")
+    return template.render()
+
+
+@lru_cache(maxsize=1)
+def _prompt_template_names() -> tuple[str, ...]:
+    return tuple(f.name for f in PROMPTS_DIR.glob("*.j2"))
 
 
 def get_prompt_templates() -> list[str]:
-    """Get list of available prompt template names."""
-    return [f.name for f in PROMPTS_DIR.glob("*.j2")]
+    """Get list of available prompt template names.
+    
+    The directory is scanned once per process; call
+    ``_prompt_template_names.cache_clear()`` to rescan.
+    """
+    return list(_prompt_template_names())
 
 
 def load_user_request_prompt(request: str, variables: dict) -> str:
     """Load and render the user request prompt.
     
+    Rendered prompts are memoized on (request, serialized variables), so
+    repeated runs with the same context skip template rendering.
+    
     Args:
         request: The user's natural language request
         variables: Workflow context variables dict
@@ -47,8 +135,7 @@ def load_user_request_prompt(request: str, variables: dict) -> str:
     Returns:
         Rendered user request prompt string
     """
-    template = _env.get_template("user_request.j2")
-    return template.render(request=request, variables=variables)
+    return _render_user_request_prompt(request, _variables_key(variables))
 
 
 def load_structured_response_prompt(agent_output: str, request: str, variables: dict) -> str:
@@ -62,7 +149,7 @@ def load_structured_response_prompt(agent_output: str, request: str, variables:
     Returns:
         Rendered structured response prompt string
     """
-    template = _env.get_template("structured_response.j2")
+    template = _get_template("structured_response.j2")
     return template.render(
         agent_output=agent_output,
         request=request,
@@ -80,5 +167,5 @@ def render_template(template_name: str, **kwargs) -> str:
     Returns:
         Rendered template string
     """
-    template = _env.get_template(template_name)
+    template = _get_template(template_name)
     return template.render(**kwargs)
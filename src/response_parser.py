@@ -0,0 +1,170 @@
+"""Fast parsing of the ReAct agent's final JSON answer.
+
+This module holds the pure string/JSON work done on every agent run, kept
+apart from the LangChain/LangGraph code in agent.py. It is fully annotated
+and has no dynamic imports beyond the optional orjson backend, so it can be
+compiled with mypyc (``mypyc src/response_parser.py``) when that speedup is
+wanted. The pure-Python module is used as-is otherwise.
+"""
+
+from typing import Iterator, Optional
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    from json import loads as _loads
+
+from src.models import AgentResponseOutput
+
+
+def iter_json_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) spans of top-level balanced JSON objects in text.
+    
+    Single left-to-right pass tracking brace depth plus string/escape state
+    inside objects, so braces within JSON strings (e.g. Liquid tags in
+    proposed_config) don't affect nesting. Prose between objects is skipped
+    with str.find rather than stepped through character by character.
+    
+    Args:
+        text: Text that may contain one or more JSON objects
+    
+    Yields:
+        (start, end) slice bounds of each top-level object
+    """
+    length: int = len(text)
+    start: int = text.find("{")
+    depth: int
+    in_string: bool
+    escaped: bool
+    i: int
+    ch: str
+    while start != -1:
+        depth = 1
+        in_string = False
+        escaped = False
+        i = start + 1
+        while i < length:
+            ch = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        else:
+            # Unbalanced object runs to the end of the text
+            return
+        yield start, i + 1
+        start = text.find("{", i + 1)
+
+
+def parse_response(agent_output: str) -> Optional[AgentResponseOutput]:
+    """Parse the ReAct agent's final JSON answer without another LLM call.
+    
+    The user request prompt asks the agent to finish with a JSON object
+    holding selected_action, reasoning and proposed_config. If such an
+    object is present and validates, it is returned directly.
+    
+    orjson.JSONDecodeError and pydantic's ValidationError are both
+    ValueError subclasses, so one except clause covers bad JSON and
+    schema mismatches.
+    
+    Args:
+        agent_output: Final text output from the ReAct agent
+    
+    Returns:
+        Validated AgentResponseOutput, or None if no usable object was found
+    """
+    start: int
+    end: int
+    for start, end in iter_json_spans(agent_output):
+        try:
+            return AgentResponseOutput.model_validate(_loads(agent_output[start:end]))
+        except ValueError:
+            # Not JSON, or JSON that doesn't match the schema
+            continue
+    return None
+
+
+class StreamingResponseParser:
+    """Incrementally parse the agent's JSON answer from streamed chunks.
+    
+    Chunks are accumulated per message while brace depth is tracked the same
+    way iter_json_spans does, ignoring braces inside JSON strings. A parse is
+    only attempted on the chunk that closes a top-level object.
+    """
+    
+    def __init__(self) -> None:
+        self._message_id: Optional[str] = None
+        self._parts: list[str] = []
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escaped: bool = False
+    
+    def feed(self, message_id: Optional[str], content: object) -> Optional[AgentResponseOutput]:
+        """Add a streamed chunk and return the answer once it is complete.
+        
+        Args:
+            message_id: ID of the message the chunk belongs to; a new ID
+                starts a new message (the model began another turn)
+            content: Chunk content; non-string content (e.g. tool-call
+                deltas) is ignored
+        
+        Returns:
+            Validated AgentResponseOutput, or None if not complete yet
+        """
+        if not content or not isinstance(content, str):
+            return None
+        
+        if message_id != self._message_id:
+            self._message_id = message_id
+            self._parts = []
+            self._depth = 0
+            self._in_string = self._escaped = False
+        self._parts.append(content)
+        
+        if self._closes_object(content):
+            return parse_response("".join(self._parts))
+        return None
+    
+    def _closes_object(self, text: str) -> bool:
+        """Advance the depth/string state over text; True if a top-level object closed."""
+        depth: int = self._depth
+        in_string: bool = self._in_string
+        escaped: bool = self._escaped
+        closed: bool = False
+        ch: str
+        for ch in text:
+            if depth == 0:
+                # Prose between objects: quotes here don't start strings
+                if ch == "{":
+                    depth = 1
+            elif in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    closed = True
+        self._depth = depth
+        self._in_string = in_string
+        self._escaped = escaped
+        return closed
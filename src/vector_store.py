@@ -5,26 +5,157 @@ This module handles:
 - Chunking documents for optimal retrieval
 - Generating embeddings with OpenAI
 - Storing and querying with ChromaDB
+
+The LangChain integrations (Chroma, OpenAI, splitters) and numpy
+are imported where they are first used, so importing this module (e.g.
+via the agent tools) stays cheap until the index is actually touched.
 """
 
-import hashlib
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
-from langchain_chroma import Chroma
 from langchain_core.documents import Document
 
+try:
+    from blake3 import blake3 as _new_hasher
+except ImportError:  # Optional speedup; hashlib's md5 is the fallback
+    from hashlib import md5 as _new_hasher
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; initialize() runs unlocked there
+    fcntl = None
+
 from src.config import (
     API_DOCS_DIR,
     CHROMA_DIR,
     CHROMA_COLLECTION_NAME,
+    EMBEDDING_DIMENSIONS,
     EMBEDDING_MODEL,
     OPENAI_API_KEY,
 )
 
+if TYPE_CHECKING:
+    from langchain_chroma import Chroma
+    from langchain_openai import OpenAIEmbeddings
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+@lru_cache(maxsize=4)
+def _get_embeddings(model: str, api_key: Optional[str], batch_size: int, dimensions: int) -> "OpenAIEmbeddings":
+    """Get a shared embeddings client for the given settings.
+    
+    Reusing the client keeps its HTTP connection pool (and warm TLS
+    sessions) across VectorStore instances. chunk_size matches the store's
+    batches, so each batch is sent as a single /v1/embeddings request.
+    """
+    from langchain_openai import OpenAIEmbeddings
+    
+    return OpenAIEmbeddings(
+        model=model,
+        dimensions=dimensions,
+        openai_api_key=api_key,
+        chunk_size=batch_size,
+        max_retries=6,
+    )
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file via a temp file and rename, so readers never see a partial write."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+# Identifies the vector space; vectors from different settings can't be mixed
+_EMBEDDING_ID = f"{EMBEDDING_MODEL}/{EMBEDDING_DIMENSIONS}"
+
+# Identifies how docs are split into chunks and what metadata they carry;
+# bump it when either changes so existing indexes are rebuilt
+_CHUNKER_VERSION = "headers-3"
+
+
+def _split_on_headers(text: str) -> list[Document]:
+    """Split markdown into one section per h1/h2 header.
+    
+    The header path is added to each section's metadata and headers stay in
+    the text. h3 subsections are short in these docs, so they stay with
+    their h2 section (the size guard still breaks an oversized section on
+    "\n### "). Lines are kept verbatim, so the indentation of the JSON
+    payload examples survives, and "#" lines inside fenced code blocks are
+    not treated as headers.
+    
+    Args:
+        text: Markdown document text
+        
+    Returns:
+        Sections in document order, with "h1"/"h2" header metadata
+    """
+    sections: list[Document] = []
+    headers: dict[str, str] = {}
+    lines: list[str] = []
+    in_fence = False
+    
+    for line in text.splitlines() + ["# "]:  # Sentinel header flushes the last section
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith(("# ", "## ")):
+            content = "\n".join(lines).strip("\n")
+            if content.strip():
+                sections.append(Document(page_content=content, metadata=headers))
+            lines = []
+            title = line.lstrip("#").strip()
+            headers = {"h1": title} if line.startswith("# ") else {**headers, "h2": title}
+        lines.append(line)
+    
+    return sections
+
+
+@lru_cache(maxsize=4)
+def _get_splitter(chunk_size: int, chunk_overlap: int) -> "RecursiveCharacterTextSplitter":
+    """Get a shared size-guard splitter for oversized header sections."""
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=["\n## ", "\n### ", "\n\n", "\n", " ", ""],
+    )
+
+
+# Chunks written to Chroma per add() call; each call is one SQLite transaction
+_WRITE_BATCH_SIZE = 250
+
+# HNSW index settings for new collections (other settings keep Chroma's
+# defaults). Cosine matches OpenAI's normalized embeddings, so distances
+# from search_with_scores are 1 - cosine similarity (0 is identical, lower
+# is closer) rather than Chroma's default squared L2; collections created
+# with another space are re-created by initialize(). The corpus is a few
+# thousand chunks at most, so a narrower query beam than the default 100
+# (ef_search) speeds up searches without measurable recall loss.
+_HNSW_CONFIG = {
+    "hnsw": {
+        "space": "cosine",
+        "ef_search": 64,
+    }
+}
+
+# Recent search results kept per store, and how long (seconds) they stay valid
+_QUERY_CACHE_SIZE = 512
+_QUERY_CACHE_TTL = 60.0
+
 
 class VectorStore:
     """ChromaDB-based vector store for API documentation retrieval.
@@ -40,7 +171,9 @@ class VectorStore:
         persist_directory: Optional[Path] = None,
         collection_name: Optional[str] = None,
         chunk_size: int = 1000,
-        chunk_overlap: int = 200,
+        chunk_overlap: int = 50,
+        embedding_batch_size: int = 512,
+        embedding_concurrency: int = 5,
     ):
         """Initialize the vector store.
         
@@ -49,121 +182,438 @@ class VectorStore:
             collection_name: Name of the ChromaDB collection
             chunk_size: Size of text chunks for splitting
             chunk_overlap: Overlap between chunks
+            embedding_batch_size: Number of chunks embedded per API request
+            embedding_concurrency: Maximum embedding requests in flight at once
         """
         self.persist_directory = persist_directory or CHROMA_DIR
         self.collection_name = collection_name or CHROMA_COLLECTION_NAME
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_concurrency = embedding_concurrency
         
-        # Initialize embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model=EMBEDDING_MODEL,
-            openai_api_key=OPENAI_API_KEY,
-        )
+        self._vectorstore: Optional["Chroma"] = None
         
-        # Text splitter for chunking documents
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n## ", "\n### ", "\n\n", "\n", " ", ""],
-        )
+        # Docs hash computed by the last initialize(), reused by get_stats()
+        self._docs_hash: Optional[str] = None
         
-        self._vectorstore: Optional[Chroma] = None
+        # Search results keyed by (method, query, k, filter), least recent first;
+        # each entry holds its expiry time. Cleared whenever the index changes.
+        self._query_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        # Guards _query_cache: one store is shared by concurrent agent runs
+        self._query_lock = threading.Lock()
+    
+    @cached_property
+    def embeddings(self) -> "OpenAIEmbeddings":
+        """Embeddings client, shared by stores with the same settings."""
+        return _get_embeddings(EMBEDDING_MODEL, OPENAI_API_KEY, self.embedding_batch_size, EMBEDDING_DIMENSIONS)
+    
+    @cached_property
+    def text_splitter(self) -> "RecursiveCharacterTextSplitter":
+        """Size-guard text splitter, shared by stores with the same settings."""
+        return _get_splitter(self.chunk_size, self.chunk_overlap)
     
-    def _load_documents(self) -> list[Document]:
-        """Load all markdown documents from the API docs directory."""
-        loader = DirectoryLoader(
-            str(API_DOCS_DIR),
-            glob="**/*.md",
-            loader_cls=TextLoader,
-            loader_kwargs={"encoding": "utf-8"},
+    def _load_documents(self, file_names: Optional[set[str]] = None) -> list[Document]:
+        """Load markdown documents from the API docs directory.
+        
+        Args:
+            file_names: Names of the files to load; all files when None
+            
+        Returns:
+            Documents sorted by path, with integration and file name metadata
+        """
+        paths = sorted(
+            path for path in API_DOCS_DIR.glob("**/*.md")
+            if file_names is None or path.name in file_names
         )
-        documents = loader.load()
         
-        # Add source metadata
-        for doc in documents:
-            # Extract filename without extension as the integration name
-            source_path = Path(doc.metadata.get("source", ""))
-            doc.metadata["integration"] = source_path.stem
-            doc.metadata["file_name"] = source_path.name
+        # Files are read on a thread pool so open/read waits overlap; map
+        # keeps path order, so chunk indexes are stable
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+            texts = list(pool.map(lambda path: path.read_text(encoding="utf-8"), paths))
         
-        return documents
+        return [
+            Document(
+                page_content=text,
+                metadata={
+                    "source": str(path),
+                    # File name without extension is the integration name
+                    "integration": path.stem,
+                    "file_name": path.name,
+                },
+            )
+            for path, text in zip(paths, texts)
+        ]
     
     def _chunk_documents(self, documents: list[Document]) -> list[Document]:
-        """Split documents into chunks for better retrieval."""
-        chunks = self.text_splitter.split_documents(documents)
+        """Split documents into chunks for better retrieval.
+        
+        Documents are split on markdown headers first, so chunks follow the
+        docs' own structure; only sections longer than chunk_size are split
+        further. Structural boundaries need little overlap, which keeps the
+        total embedded text (and embedding cost) down.
+        """
+        sections = []
+        for doc in documents:
+            for section in _split_on_headers(doc.page_content):
+                section.metadata = {**doc.metadata, **section.metadata}
+                sections.append(section)
+        chunks = self.text_splitter.split_documents(sections)
         
-        # Add chunk index to metadata
-        for i, chunk in enumerate(chunks):
-            chunk.metadata["chunk_index"] = i
-            # Create a unique ID for the chunk
-            content_hash = hashlib.md5(chunk.page_content.encode()).hexdigest()[:8]
-            chunk.metadata["chunk_id"] = f"{chunk.metadata.get('integration', 'unknown')}_{content_hash}"
+        # Number chunks within their file, so indexes don't depend on which
+        # other files are being indexed alongside it
+        chunk_counts: dict[str, int] = {}
+        for chunk in chunks:
+            file_name = chunk.metadata["file_name"]
+            chunk.metadata["chunk_index"] = chunk_counts.get(file_name, 0)
+            chunk_counts[file_name] = chunk.metadata["chunk_index"] + 1
+            # Full content hash keys the embedding cache and, with the
+            # integration, is the chunk's Chroma ID
+            content_hash = _new_hasher(chunk.page_content.encode()).hexdigest()
+            chunk.metadata["content_hash"] = content_hash
+            chunk.metadata["chunk_id"] = f"{chunk.metadata['integration']}_{content_hash}"
         
         return chunks
     
-    def _get_docs_hash(self) -> str:
-        """Get a hash of all document contents for change detection."""
-        content = ""
-        for doc_path in sorted(API_DOCS_DIR.glob("**/*.md")):
-            content += doc_path.read_text()
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+    def _embed_chunks(self, chunks: list[Document]) -> list[list[float]]:
+        """Embed chunks, reusing cached vectors for unchanged text.
+        
+        Vectors are cached on disk by content hash and embedding model, so
+        chunks whose text survives an edit or a rebuild aren't sent to the
+        API again. Only cache misses are embedded.
+        
+        Args:
+            chunks: Chunks to embed (from _chunk_documents)
+            
+        Returns:
+            Embedding vectors in the same order as chunks
+        """
+        hashes = [chunk.metadata["content_hash"] for chunk in chunks]
+        
+        # closing() closes the connection; the inner "conn" commits the inserts
+        with closing(self._open_embedding_cache()) as conn, conn:
+            vectors = self._load_cached_embeddings(conn, hashes)
+            
+            # Embed each distinct missing text once
+            missing = {}
+            for chunk, content_hash in zip(chunks, hashes):
+                if content_hash not in vectors:
+                    missing[content_hash] = chunk.page_content
+            if missing:
+                fresh = dict(zip(missing, self._embed_texts(list(missing.values()))))
+                self._store_cached_embeddings(conn, fresh)
+                vectors.update(fresh)
+        
+        return [vectors[content_hash] for content_hash in hashes]
+    
+    def _open_embedding_cache(self) -> sqlite3.Connection:
+        """Open (creating if needed) the embedding cache beside the index."""
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.persist_directory / "embeddings.db")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "content_hash TEXT NOT NULL, model TEXT NOT NULL, vector BLOB NOT NULL, "
+            "PRIMARY KEY (content_hash, model))"
+        )
+        return conn
+    
+    def _load_cached_embeddings(self, conn: sqlite3.Connection, hashes: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors for the given content hashes."""
+        import numpy as np
+        
+        vectors: dict[str, list[float]] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(unique_hashes), 500):
+            batch = unique_hashes[i:i + 500]
+            rows = conn.execute(
+                f"SELECT content_hash, vector FROM embedding_cache "
+                f"WHERE model = ? AND content_hash IN ({','.join('?' * len(batch))})",
+                [_EMBEDDING_ID, *batch],
+            )
+            for content_hash, blob in rows:
+                vectors[content_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return vectors
+    
+    def _store_cached_embeddings(self, conn: sqlite3.Connection, vectors: dict[str, list[float]]) -> None:
+        """Save vectors to the cache as float32 blobs (what Chroma stores anyway)."""
+        import numpy as np
+        
+        conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (content_hash, model, vector) VALUES (?, ?, ?)",
+            [
+                (content_hash, _EMBEDDING_ID, np.asarray(vector, dtype=np.float32).tobytes())
+                for content_hash, vector in vectors.items()
+            ],
+        )
+    
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, one API request per embedding_batch_size texts.
+        
+        Batches are sent concurrently (see _aembed_texts). When called from
+        inside a running event loop, where asyncio.run isn't allowed, the
+        batches are sent one after another instead.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._aembed_texts(texts))
+        
+        vectors: list[list[float]] = []
+        for i in range(0, len(texts), self.embedding_batch_size):
+            vectors.extend(self.embeddings.embed_documents(texts[i:i + self.embedding_batch_size]))
+        return vectors
+    
+    async def _aembed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts with up to embedding_concurrency batches in flight.
+        
+        Embedding requests are dominated by network latency, so overlapping
+        them cuts indexing time roughly by the concurrency factor. A small
+        random delay before each request keeps the batches from hitting the
+        rate limiter at the same instant.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(self.embedding_concurrency)
+        
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                await asyncio.sleep(random.uniform(0, 0.05))
+                return await self.embeddings.aembed_documents(batch)
+        
+        # gather returns results in submission order
+        batches = await asyncio.gather(*(
+            embed_batch(texts[i:i + self.embedding_batch_size])
+            for i in range(0, len(texts), self.embedding_batch_size)
+        ))
+        return [vector for batch in batches for vector in batch]
+    
+    def _add_chunks(self, chunks: list[Document], vectors: list[list[float]]) -> None:
+        """Write chunks and their precomputed vectors to the collection.
+        
+        Each chunk's ID is its integration plus its content hash, so
+        identical chunks of one file are stored once (and can't fill several
+        of a filtered search's k slots) and re-adding a chunk overwrites it
+        instead of duplicating it. Writes go in batches of _WRITE_BATCH_SIZE,
+        which amortizes Chroma's per-call transaction cost and stays under
+        its maximum batch size.
+        
+        Args:
+            chunks: Chunks to store
+            vectors: Embedding vectors in the same order as chunks
+        """
+        # Keep the first of any identical chunks; Chroma rejects duplicate
+        # IDs within one call
+        unique: dict[str, tuple[Document, list[float]]] = {}
+        for chunk, vector in zip(chunks, vectors):
+            unique.setdefault(chunk.metadata["chunk_id"], (chunk, vector))
+        ids = list(unique)
+        entries = list(unique.values())
+        
+        collection = self._vectorstore._collection
+        for i in range(0, len(ids), _WRITE_BATCH_SIZE):
+            batch = entries[i:i + _WRITE_BATCH_SIZE]
+            collection.upsert(
+                ids=ids[i:i + _WRITE_BATCH_SIZE],
+                embeddings=[vector for _, vector in batch],
+                documents=[chunk.page_content for chunk, _ in batch],
+                metadatas=[chunk.metadata for chunk, _ in batch],
+            )
+    
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """Hash a file's bytes, streamed in fixed-size blocks."""
+        hasher = _new_hasher()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                hasher.update(block)
+        return hasher.hexdigest()
+    
+    def _get_file_hashes(self) -> dict[str, str]:
+        """Get a content hash for each markdown file, keyed by file name."""
+        return {
+            doc_path.name: self._hash_file(doc_path)
+            for doc_path in sorted(API_DOCS_DIR.glob("**/*.md"))
+        }
+    
+    def _get_docs_hash(self, file_hashes: Optional[dict[str, str]] = None) -> str:
+        """Get a hash of all document contents for change detection.
+        
+        Combines the per-file hashes (file names included, so a rename is
+        also a change), the embedding settings and the chunker version, so
+        an index built with another model, dimension count or chunking is
+        rebuilt; files are streamed, so
+        the corpus is never held in memory.
+        
+        Args:
+            file_hashes: Per-file hashes from _get_file_hashes, if already computed
+        """
+        if file_hashes is None:
+            file_hashes = self._get_file_hashes()
+        hasher = _new_hasher(f"{_EMBEDDING_ID}\n{_CHUNKER_VERSION}\n".encode())
+        for name, digest in file_hashes.items():
+            hasher.update(f"{name}:{digest}\n".encode())
+        return hasher.hexdigest()[:12]
+    
+    def _index_files(self, file_names: set[str]) -> None:
+        """Load, chunk, embed and store the given doc files.
+        
+        Kept separate from _initialize so the document texts, chunks and
+        vectors are released as soon as they are stored, instead of staying
+        alive until initialization finishes.
+        
+        Args:
+            file_names: Names of the markdown files to index
+        """
+        documents = self._load_documents(file_names)
+        chunks = self._chunk_documents(documents)
+        
+        # Add the chunks with precomputed vectors, so Chroma doesn't embed them again
+        if chunks:
+            self._add_chunks(chunks, self._embed_chunks(chunks))
+    
+    def _open_collection(self) -> "Chroma":
+        """Open the persisted collection, creating it with _HNSW_CONFIG if new."""
+        from langchain_chroma import Chroma
+        
+        return Chroma(
+            collection_name=self.collection_name,
+            embedding_function=self.embeddings,
+            persist_directory=str(self.persist_directory),
+            collection_configuration=_HNSW_CONFIG,
+        )
+    
+    def _has_configured_space(self) -> bool:
+        """Check that the open collection uses _HNSW_CONFIG's distance space."""
+        hnsw = self._vectorstore._collection.configuration_json.get("hnsw") or {}
+        return hnsw.get("space") == _HNSW_CONFIG["hnsw"]["space"]
     
     def initialize(self, force_rebuild: bool = False) -> int:
         """Initialize the vector store by loading and indexing documents.
         
+        Only files that changed since the last run are re-indexed: a
+        manifest of per-file hashes is kept beside the index, chunks of
+        modified and deleted files are removed, and only added or modified
+        files are chunked and embedded.
+        
+        Concurrent initializers (e.g. several worker processes) are
+        serialized with a lock file in the persist directory, so only the
+        first one rebuilds and the rest load its index.
+        
         Args:
             force_rebuild: If True, rebuild even if index exists
             
         Returns:
-            Number of chunks indexed
+            Number of chunks in the index
         """
-        import shutil
-        
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        with open(self.persist_directory / ".lock", "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            return self._initialize(force_rebuild)
+    
+    def _initialize(self, force_rebuild: bool) -> int:
+        """Body of initialize(), run while holding the lock."""
         # Check if we need to rebuild
         persist_path = self.persist_directory
         hash_file = persist_path / ".docs_hash"
-        current_hash = self._get_docs_hash()
+        manifest_file = persist_path / ".docs_manifest.json"
+        file_hashes = self._get_file_hashes()
+        current_hash = self._get_docs_hash(file_hashes)
+        self._docs_hash = current_hash
+        with self._query_lock:
+            self._query_cache.clear()
         
-        if not force_rebuild and persist_path.exists() and hash_file.exists():
+        if not force_rebuild and hash_file.exists():
             stored_hash = hash_file.read_text().strip()
             if stored_hash == current_hash:
                 # Load existing index
-                self._vectorstore = Chroma(
-                    collection_name=self.collection_name,
-                    embedding_function=self.embeddings,
-                    persist_directory=str(persist_path),
-                )
-                return self._vectorstore._collection.count()
-        
-        # Force rebuild: clear existing data
-        if force_rebuild and persist_path.exists():
-            # Remove all files except .gitkeep
-            for item in persist_path.iterdir():
-                if item.name != ".gitkeep":
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-        
-        # Load and process documents
-        documents = self._load_documents()
-        chunks = self._chunk_documents(documents)
+                self._vectorstore = self._open_collection()
+                if self._has_configured_space():
+                    return self._vectorstore._collection.count()
         
-        # Create vector store
-        self._vectorstore = Chroma.from_documents(
-            documents=chunks,
-            embedding=self.embeddings,
-            collection_name=self.collection_name,
-            persist_directory=str(persist_path),
-        )
+        self._vectorstore = self._open_collection()
+        
+        # Diff against the files indexed last time. On a forced rebuild,
+        # without a manifest (so the collection's contents are unknown), when
+        # the stored chunks use other embedding or chunking settings, or when
+        # the collection was created with another distance space (fixed at
+        # creation), re-create the collection and index every file.
+        manifest = {}
+        if not force_rebuild and manifest_file.exists():
+            manifest = json.loads(manifest_file.read_text())
+        if (
+            manifest.get("embedding") == _EMBEDDING_ID
+            and manifest.get("chunker") == _CHUNKER_VERSION
+            and self._has_configured_space()
+        ):
+            stored_hashes = manifest["files"]
+        else:
+            stored_hashes = {}
+            self._vectorstore.reset_collection()
+        changed = {name for name, digest in file_hashes.items() if stored_hashes.get(name) != digest}
+        removed = {name for name, digest in stored_hashes.items() if file_hashes.get(name) != digest}
+        
+        # Changed files are cleared too, in case an interrupted run already
+        # added some of their chunks
+        collection = self._vectorstore._collection
+        for name in changed | removed:
+            collection.delete(where={"file_name": name})
+        
+        # Only changed files are chunked and embedded
+        if changed:
+            self._index_files(changed)
         
-        # Store hash for change detection
-        persist_path.mkdir(parents=True, exist_ok=True)
-        hash_file.write_text(current_hash)
+        # Store the manifest and hash for change detection
+        _write_atomic(manifest_file, json.dumps(
+            {"embedding": _EMBEDDING_ID, "chunker": _CHUNKER_VERSION, "files": file_hashes}, indent=2
+        ))
+        _write_atomic(hash_file, current_hash)
         
-        return len(chunks)
+        return collection.count()
+    
+    @staticmethod
+    def _copy_results(results: list) -> list:
+        """Deep-copy search results (Documents or (Document, score) tuples).
+        
+        The cache keeps its own copies and hands out fresh ones, so a caller
+        editing a Document's metadata or content never changes later hits.
+        """
+        return [
+            (item[0].model_copy(deep=True), item[1]) if isinstance(item, tuple) else item.model_copy(deep=True)
+            for item in results
+        ]
+    
+    def _cached_query(self, key: tuple) -> Optional[list]:
+        """Return a copy of unexpired cached search results for key, if any."""
+        with self._query_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at < time.monotonic():
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+        return self._copy_results(results)
+    
+    def _cache_query(self, key: tuple, results: list) -> None:
+        """Remember a copy of search results, evicting the least recently used."""
+        results = self._copy_results(results)
+        with self._query_lock:
+            self._query_cache[key] = (time.monotonic() + _QUERY_CACHE_TTL, results)
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
     
     def search(
         self,
@@ -184,6 +634,12 @@ class VectorStore:
         if self._vectorstore is None:
             raise RuntimeError("Vector store not initialized. Call initialize() first.")
         
+        # Repeated queries skip the query embedding request and the index lookup
+        cache_key = ("search", query, k, filter_integration)
+        cached = self._cached_query(cache_key)
+        if cached is not None:
+            return cached
+        
         # Build filter if specified
         where_filter = None
         if filter_integration:
@@ -195,6 +651,7 @@ class VectorStore:
             filter=where_filter,
         )
         
+        self._cache_query(cache_key, results)
         return results
     
     def search_with_scores(
@@ -211,11 +668,18 @@ class VectorStore:
             filter_integration: Optional filter by integration name
             
         Returns:
-            List of (Document, score) tuples
+            List of (Document, score) tuples, closest first. Scores are
+            cosine distances (1 - cosine similarity, from 0 to 2), so lower
+            means more relevant.
         """
         if self._vectorstore is None:
             raise RuntimeError("Vector store not initialized. Call initialize() first.")
         
+        cache_key = ("search_with_scores", query, k, filter_integration)
+        cached = self._cached_query(cache_key)
+        if cached is not None:
+            return cached
+        
         where_filter = None
         if filter_integration:
             where_filter = {"integration": filter_integration}
@@ -226,8 +690,67 @@ class VectorStore:
             filter=where_filter,
         )
         
+        self._cache_query(cache_key, results)
         return results
     
+    def batch_search(
+        self,
+        queries: list[str],
+        k: int = 4,
+        filter_integration: Optional[str] = None,
+        filter_integrations: Optional[list[Optional[str]]] = None,
+    ) -> list[list[Document]]:
+        """Search for several queries at once.
+        
+        All queries are embedded in one API request and looked up with one
+        collection query per distinct filter, instead of one round-trip per
+        query.
+        
+        Args:
+            queries: Search queries
+            k: Number of results to return per query
+            filter_integration: Optional filter by integration name
+            filter_integrations: Optional per-query integration filters
+                (parallel to queries); overrides filter_integration
+            
+        Returns:
+            One list of relevant Document objects per query, in query order
+        """
+        if self._vectorstore is None:
+            raise RuntimeError("Vector store not initialized. Call initialize() first.")
+        
+        if not queries:
+            return []
+        
+        if filter_integrations is None:
+            filter_integrations = [filter_integration] * len(queries)
+        
+        vectors = self.embeddings.embed_documents(queries)
+        
+        # Chroma applies one where clause per query call, so group queries
+        # that share a filter
+        groups: dict[Optional[str], list[int]] = {}
+        for i, integration in enumerate(filter_integrations):
+            groups.setdefault(integration or None, []).append(i)
+        
+        docs: list[list[Document]] = [[] for _ in queries]
+        for integration, indices in groups.items():
+            results = self._vectorstore._collection.query(
+                query_embeddings=[vectors[i] for i in indices],
+                n_results=k,
+                where={"integration": integration} if integration else None,
+                include=["documents", "metadatas"],
+            )
+            for i, ids, texts, metadatas in zip(
+                indices, results["ids"], results["documents"], results["metadatas"]
+            ):
+                docs[i] = [
+                    Document(page_content=text, metadata=metadata or {}, id=doc_id)
+                    for doc_id, text, metadata in zip(ids, texts, metadatas)
+                ]
+        
+        return docs
+    
     def get_retriever(self, k: int = 4):
         """Get a LangChain retriever for use in chains.
         
@@ -255,7 +778,7 @@ class VectorStore:
             "collection_name": self.collection_name,
             "total_chunks": self._vectorstore._collection.count(),
             "persist_directory": str(self.persist_directory),
-            "docs_hash": self._get_docs_hash(),
+            "docs_hash": self._docs_hash or self._get_docs_hash(),
         }
 
 
@@ -0,0 +1,23 @@
+"""Shared pytest fixtures."""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
+
+
+@pytest.fixture(scope="module")
+def agent_deps():
+    """Patch the agent's LLM client, config check and graph builder once per module.
+    
+    Entering and exiting patch() for every test dominates the cost of the
+    small agent tests, so the patches stay active for the whole module.
+    Tests configure ``agent_deps.llm`` (ChatOpenAI) and ``agent_deps.react``
+    (create_react_agent) directly and should reset them between tests.
+    """
+    with patch.multiple(
+        'src.agent',
+        ChatOpenAI=DEFAULT,
+        validate_config=DEFAULT,
+        create_react_agent=DEFAULT,
+    ) as mocks:
+        yield SimpleNamespace(llm=mocks['ChatOpenAI'], react=mocks['create_react_agent'])
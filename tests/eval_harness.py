@@ -14,15 +14,23 @@ Features:
 import json
 import hashlib
 import subprocess
+import threading
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Callable, Optional, Sequence
+from dataclasses import dataclass, field, fields, asdict
 
 from liquid import Template
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
+
 # Add project root to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -31,7 +39,43 @@ from src.config import RESULTS_DIR, PROMPTS_DIR, DATA_DIR
 from src.models import AgentResponse, WorkflowContext
 
 
-@dataclass
+def _json_loads(data: str | bytes):
+    """Parse JSON with orjson when available, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_line(obj) -> bytes:
+    """Encode obj as one line of newline-delimited JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode() + b"\n"
+
+
+@lru_cache(maxsize=1)
+def _git_sha() -> str:
+    """Short HEAD SHA, cached per process; "unknown" outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent.parent
+        )
+        return result.stdout.strip() if result.returncode == 0 else "unknown"
+    except Exception:
+        return "unknown"
+
+
+@lru_cache(maxsize=512)
+def _compile_liquid(source: str) -> Template:
+    """Compile a Liquid template, memoized on its source string."""
+    return Template(source)
+
+
+@dataclass(frozen=True, slots=True)
 class TestScenario:
     """A single test scenario for evaluation."""
     request: str
@@ -40,7 +84,7 @@ class TestScenario:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioResult:
     """Result of running a single scenario."""
     scenario_id: int
@@ -57,7 +101,12 @@ class ScenarioResult:
     error: Optional[str] = None
 
 
-@dataclass
+# ScenarioResult holds only flat values, so results are converted to dicts by
+# reading these fields directly rather than with asdict's recursive copy
+_SCENARIO_FIELDS = tuple(f.name for f in fields(ScenarioResult))
+
+
+@dataclass(slots=True)
 class EvalResults:
     """Complete evaluation results."""
     timestamp: str
@@ -71,6 +120,213 @@ class EvalResults:
         return asdict(self)
 
 
+# Everything but the per-scenario details, written as the first line of
+# streamed (.jsonl) results
+_RESULTS_HEADER_FIELDS = tuple(f.name for f in fields(EvalResults) if f.name != "details")
+
+
+# Default test scenarios covering all integrations. Built once at import and
+# shared by every EvalHarness as an immutable tuple.
+_DEFAULT_SCENARIOS: tuple[TestScenario, ...] = (
+    TestScenario(
+        request="Post the summary to Slack",
+        expected_action="slack_post_message",
+        context={
+            "user_input": "Post the summary to Slack",
+            "variables": {
+                "summary": "Found 3 products. Average price: $91.66. Lowest: USB-C Hub ($45.00)",
+                "slack_channel": "#product-alerts",
+                "scraper_results": [
+                    {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"}
+                ]
+            }
+        },
+        description="Simple variable interpolation for Slack message"
+    ),
+    TestScenario(
+        request="Add these products to my Notion database",
+        expected_action="notion_create_page",
+        context={
+            "user_input": "Add these products to my Notion database",
+            "variables": {
+                "scraper_results": [
+                    {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"},
+                    {"name": "USB-C Hub", "price": 45.0, "url": "https://store.example.com/p/1002"},
+                    {"name": "Mechanical Keyboard", "price": 149.99, "url": "https://store.example.com/p/1003"}
+                ],
+                "notion_database_id": "8a3b1c4d-5e6f-7a8b-9c0d-1e2f3a4b5c6d"
+            }
+        },
+        description="Array loop for creating Notion pages"
+    ),
+    TestScenario(
+        request="Create a GitHub issue for the failed scrape",
+        expected_action="github_create_issue",
+        context={
+            "user_input": "Create a GitHub issue for the failed scrape",
+            "variables": {
+                "summary": "Scrape failed: Connection timeout after 30s. URL: https://store.example.com",
+                "error_details": "TimeoutError: Request exceeded 30000ms"
+            }
+        },
+        description="String interpolation for GitHub issue"
+    ),
+    TestScenario(
+        request="Add these results to the existing spreadsheet",
+        expected_action="google_sheets_append",
+        context={
+            "user_input": "Add these results to the existing spreadsheet",
+            "variables": {
+                "scraper_results": [
+                    {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"},
+                    {"name": "USB-C Hub", "price": 45.0, "url": "https://store.example.com/p/1002"}
+                ],
+                "spreadsheet_id": "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
+            }
+        },
+        description="Array loop for appending to existing spreadsheet"
+    ),
+    # ===== Extended scenarios for all 13 actions =====
+    TestScenario(
+        request="Update the Notion block with the new status message",
+        expected_action="notion_update_block",
+        context={
+            "user_input": "Update the Notion block with the new status message",
+            "variables": {
+                "block_id": "b1c2d3e4-5f6a-7b8c-9d0e-1f2a3b4c5d6e",
+                "new_content": "Status: Completed ✅ - All tasks finished successfully.",
+                "status": "completed"
+            }
+        },
+        description="Notion block update with text content"
+    ),
+    TestScenario(
+        request="Create a record in my Airtable base with the product data",
+        expected_action="airtable_create_record",
+        context={
+            "user_input": "Create a record in my Airtable base with the product data",
+            "variables": {
+                "base_id": "appXYZ123456789",
+                "table_name": "Products",
+                "product_data": {
+                    "name": "New Product",
+                    "price": 99.99,
+                    "category": "Electronics",
+                    "in_stock": True
+                }
+            }
+        },
+        description="Airtable record creation with product fields"
+    ),
+    TestScenario(
+        request="Add this lead as a contact in HubSpot",
+        expected_action="hubspot_create_contact",
+        context={
+            "user_input": "Add this lead as a contact in HubSpot",
+            "variables": {
+                "lead": {
+                    "email": "john.smith@acmecorp.com",
+                    "first_name": "John",
+                    "last_name": "Smith",
+                    "company": "Acme Corporation",
+                    "job_title": "VP of Engineering",
+                    "phone": "+1-555-123-4567"
+                }
+            }
+        },
+        description="HubSpot contact creation with lead data"
+    ),
+    TestScenario(
+        request="Create a Trello card for this task",
+        expected_action="trello_create_card",
+        context={
+            "user_input": "Create a Trello card for this task",
+            "variables": {
+                "list_id": "5f1a2b3c4d5e6f7a8b9c0d1e",
+                "task": {
+                    "name": "Review pull request #42",
+                    "description": "Code review needed for the authentication module updates",
+                    "due_date": "2024-01-15T17:00:00Z"
+                }
+            }
+        },
+        description="Trello card creation with task details"
+    ),
+    TestScenario(
+        request="Create a Jira ticket for this bug",
+        expected_action="jira_create_issue",
+        context={
+            "user_input": "Create a Jira ticket for this bug",
+            "variables": {
+                "project_key": "PROJ",
+                "bug": {
+                    "summary": "Login page returns 500 error on mobile",
+                    "description": "Users on iOS Safari cannot log in. Error occurs after entering credentials.",
+                    "priority": "High"
+                },
+                "labels": ["mobile", "urgent", "login"]
+            }
+        },
+        description="Jira issue creation for bug tracking"
+    ),
+    TestScenario(
+        request="Create a new customer in Stripe for this signup",
+        expected_action="stripe_create_customer",
+        context={
+            "user_input": "Create a new customer in Stripe for this signup",
+            "variables": {
+                "customer": {
+                    "email": "newuser@example.com",
+                    "name": "Jane Doe",
+                    "phone": "+1-555-987-6543"
+                },
+                "plan": "premium",
+                "signup_source": "landing_page"
+            }
+        },
+        description="Stripe customer creation with metadata"
+    ),
+    TestScenario(
+        request="Send an email notification via SendGrid about the order",
+        expected_action="sendgrid_send_email",
+        context={
+            "user_input": "Send an email notification via SendGrid about the order",
+            "variables": {
+                "recipient": {
+                    "email": "customer@example.com",
+                    "name": "John Customer"
+                },
+                "order": {
+                    "id": "ORD-12345",
+                    "total": "$149.99",
+                    "status": "shipped"
+                },
+                "from_email": "orders@store.com",
+                "from_name": "Store Notifications"
+            }
+        },
+        description="SendGrid email for order notification"
+    ),
+    TestScenario(
+        request="Send an SMS alert via Twilio about the system status",
+        expected_action="twilio_send_sms",
+        context={
+            "user_input": "Send an SMS alert via Twilio about the system status",
+            "variables": {
+                "alert_phone": "+14155551234",
+                "twilio_number": "+14155559876",
+                "alert": {
+                    "type": "warning",
+                    "message": "CPU usage exceeded 90% on production server",
+                    "timestamp": "2024-01-08T14:30:00Z"
+                }
+            }
+        },
+        description="Twilio SMS for system alerts"
+    ),
+)
+
+
 class EvalHarness:
     """Evaluation harness for tracking Integration Agent performance.
     
@@ -80,240 +336,39 @@ class EvalHarness:
         harness.save_results(results, "eval_v1.json")
     """
     
-    # Default test scenarios covering all integrations
-    DEFAULT_SCENARIOS = [
-        TestScenario(
-            request="Post the summary to Slack",
-            expected_action="slack_post_message",
-            context={
-                "user_input": "Post the summary to Slack",
-                "variables": {
-                    "summary": "Found 3 products. Average price: $91.66. Lowest: USB-C Hub ($45.00)",
-                    "slack_channel": "#product-alerts",
-                    "scraper_results": [
-                        {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"}
-                    ]
-                }
-            },
-            description="Simple variable interpolation for Slack message"
-        ),
-        TestScenario(
-            request="Add these products to my Notion database",
-            expected_action="notion_create_page",
-            context={
-                "user_input": "Add these products to my Notion database",
-                "variables": {
-                    "scraper_results": [
-                        {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"},
-                        {"name": "USB-C Hub", "price": 45.0, "url": "https://store.example.com/p/1002"},
-                        {"name": "Mechanical Keyboard", "price": 149.99, "url": "https://store.example.com/p/1003"}
-                    ],
-                    "notion_database_id": "8a3b1c4d-5e6f-7a8b-9c0d-1e2f3a4b5c6d"
-                }
-            },
-            description="Array loop for creating Notion pages"
-        ),
-        TestScenario(
-            request="Create a GitHub issue for the failed scrape",
-            expected_action="github_create_issue",
-            context={
-                "user_input": "Create a GitHub issue for the failed scrape",
-                "variables": {
-                    "summary": "Scrape failed: Connection timeout after 30s. URL: https://store.example.com",
-                    "error_details": "TimeoutError: Request exceeded 30000ms"
-                }
-            },
-            description="String interpolation for GitHub issue"
-        ),
-        TestScenario(
-            request="Add these results to the existing spreadsheet",
-            expected_action="google_sheets_append",
-            context={
-                "user_input": "Add these results to the existing spreadsheet",
-                "variables": {
-                    "scraper_results": [
-                        {"name": "Wireless Headphones", "price": 79.99, "url": "https://store.example.com/p/1001"},
-                        {"name": "USB-C Hub", "price": 45.0, "url": "https://store.example.com/p/1002"}
-                    ],
-                    "spreadsheet_id": "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
-                }
-            },
-            description="Array loop for appending to existing spreadsheet"
-        ),
-        # ===== Extended scenarios for all 13 actions =====
-        TestScenario(
-            request="Update the Notion block with the new status message",
-            expected_action="notion_update_block",
-            context={
-                "user_input": "Update the Notion block with the new status message",
-                "variables": {
-                    "block_id": "b1c2d3e4-5f6a-7b8c-9d0e-1f2a3b4c5d6e",
-                    "new_content": "Status: Completed ✅ - All tasks finished successfully.",
-                    "status": "completed"
-                }
-            },
-            description="Notion block update with text content"
-        ),
-        TestScenario(
-            request="Create a record in my Airtable base with the product data",
-            expected_action="airtable_create_record",
-            context={
-                "user_input": "Create a record in my Airtable base with the product data",
-                "variables": {
-                    "base_id": "appXYZ123456789",
-                    "table_name": "Products",
-                    "product_data": {
-                        "name": "New Product",
-                        "price": 99.99,
-                        "category": "Electronics",
-                        "in_stock": True
-                    }
-                }
-            },
-            description="Airtable record creation with product fields"
-        ),
-        TestScenario(
-            request="Add this lead as a contact in HubSpot",
-            expected_action="hubspot_create_contact",
-            context={
-                "user_input": "Add this lead as a contact in HubSpot",
-                "variables": {
-                    "lead": {
-                        "email": "john.smith@acmecorp.com",
-                        "first_name": "John",
-                        "last_name": "Smith",
-                        "company": "Acme Corporation",
-                        "job_title": "VP of Engineering",
-                        "phone": "+1-555-123-4567"
-                    }
-                }
-            },
-            description="HubSpot contact creation with lead data"
-        ),
-        TestScenario(
-            request="Create a Trello card for this task",
-            expected_action="trello_create_card",
-            context={
-                "user_input": "Create a Trello card for this task",
-                "variables": {
-                    "list_id": "5f1a2b3c4d5e6f7a8b9c0d1e",
-                    "task": {
-                        "name": "Review pull request #42",
-                        "description": "Code review needed for the authentication module updates",
-                        "due_date": "2024-01-15T17:00:00Z"
-                    }
-                }
-            },
-            description="Trello card creation with task details"
-        ),
-        TestScenario(
-            request="Create a Jira ticket for this bug",
-            expected_action="jira_create_issue",
-            context={
-                "user_input": "Create a Jira ticket for this bug",
-                "variables": {
-                    "project_key": "PROJ",
-                    "bug": {
-                        "summary": "Login page returns 500 error on mobile",
-                        "description": "Users on iOS Safari cannot log in. Error occurs after entering credentials.",
-                        "priority": "High"
-                    },
-                    "labels": ["mobile", "urgent", "login"]
-                }
-            },
-            description="Jira issue creation for bug tracking"
-        ),
-        TestScenario(
-            request="Create a new customer in Stripe for this signup",
-            expected_action="stripe_create_customer",
-            context={
-                "user_input": "Create a new customer in Stripe for this signup",
-                "variables": {
-                    "customer": {
-                        "email": "newuser@example.com",
-                        "name": "Jane Doe",
-                        "phone": "+1-555-987-6543"
-                    },
-                    "plan": "premium",
-                    "signup_source": "landing_page"
-                }
-            },
-            description="Stripe customer creation with metadata"
-        ),
-        TestScenario(
-            request="Send an email notification via SendGrid about the order",
-            expected_action="sendgrid_send_email",
-            context={
-                "user_input": "Send an email notification via SendGrid about the order",
-                "variables": {
-                    "recipient": {
-                        "email": "customer@example.com",
-                        "name": "John Customer"
-                    },
-                    "order": {
-                        "id": "ORD-12345",
-                        "total": "$149.99",
-                        "status": "shipped"
-                    },
-                    "from_email": "orders@store.com",
-                    "from_name": "Store Notifications"
-                }
-            },
-            description="SendGrid email for order notification"
-        ),
-        TestScenario(
-            request="Send an SMS alert via Twilio about the system status",
-            expected_action="twilio_send_sms",
-            context={
-                "user_input": "Send an SMS alert via Twilio about the system status",
-                "variables": {
-                    "alert_phone": "+14155551234",
-                    "twilio_number": "+14155559876",
-                    "alert": {
-                        "type": "warning",
-                        "message": "CPU usage exceeded 90% on production server",
-                        "timestamp": "2024-01-08T14:30:00Z"
-                    }
-                }
-            },
-            description="Twilio SMS for system alerts"
-        ),
-    ]
+    DEFAULT_SCENARIOS = _DEFAULT_SCENARIOS
     
-    def __init__(self, scenarios: Optional[list[TestScenario]] = None):
+    def __init__(self, scenarios: Optional[Sequence[TestScenario]] = None):
         """Initialize the eval harness with test scenarios.
         
         Args:
             scenarios: Custom scenarios or None for defaults
         """
-        self.scenarios = scenarios or self.DEFAULT_SCENARIOS
+        self.scenarios = scenarios or _DEFAULT_SCENARIOS
+        
+        # Prompts and HEAD don't change during an eval session
+        self._git_sha = self.get_git_sha()
+        self._prompt_hash = self.get_prompt_hash()
     
     @staticmethod
     def get_git_sha() -> str:
-        """Get current git commit SHA."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                capture_output=True,
-                text=True,
-                cwd=Path(__file__).parent.parent
-            )
-            return result.stdout.strip() if result.returncode == 0 else "unknown"
-        except Exception:
-            return "unknown"
+        """Get current git commit SHA (looked up once per process)."""
+        return _git_sha()
     
     @staticmethod
     def get_prompt_hash() -> str:
         """Get hash of prompt files for version tracking."""
         try:
-            prompt_content = ""
-            for prompt_file in sorted(PROMPTS_DIR.glob("*.j2")):
-                prompt_content += prompt_file.read_text()
-            
-            if not prompt_content:
+            prompt_files = sorted(PROMPTS_DIR.glob("*.j2"))
+            if not prompt_files:
                 return "no-prompts"
             
-            return hashlib.md5(prompt_content.encode()).hexdigest()[:8]
+            hasher = hashlib.blake2b(digest_size=4)
+            for prompt_file in prompt_files:
+                with open(prompt_file, "rb") as f:
+                    for block in iter(lambda: f.read(65536), b""):
+                        hasher.update(block)
+            return hasher.hexdigest()
         except Exception:
             return "unknown"
     
@@ -331,26 +386,32 @@ class EvalHarness:
         Returns:
             Tuple of (is_valid_liquid, renders_to_valid_json, rendered_string)
         """
-        try:
-            template = Template(config_str)
-            rendered = template.render(**context.get("variables", {}))
-            
-            # Try to parse as JSON
-            json.loads(rendered)
-            return True, True, rendered
-            
-        except json.JSONDecodeError:
-            # Valid Liquid but doesn't render to valid JSON
+        if not config_str or config_str.isspace():
+            # Empty output from a failed agent run is not a template
+            return False, False, None
+        
+        if "{{" not in config_str and "{%" not in config_str:
+            # No output or tag markup: Liquid would render the text verbatim
+            rendered = config_str
+        else:
             try:
-                template = Template(config_str)
+                template = _compile_liquid(config_str)
                 rendered = template.render(**context.get("variables", {}))
-                return True, False, rendered
             except Exception:
+                # Invalid Liquid. Render errors count too: python-liquid only
+                # reports some invalid templates (e.g. an unknown filter such
+                # as "| json") when rendering, and a template that can't be
+                # rendered is unusable, so it isn't counted as valid Liquid.
                 return False, False, None
-                
-        except Exception:
-            # Invalid Liquid syntax
-            return False, False, None
+        
+        try:
+            # Try to parse as JSON (orjson's decode error subclasses
+            # json.JSONDecodeError, so the except clause covers both)
+            _json_loads(rendered)
+            return True, True, rendered
+        except json.JSONDecodeError:
+            # Valid Liquid but doesn't render to valid JSON
+            return True, False, rendered
     
     def run_scenario(
         self,
@@ -376,11 +437,10 @@ class EvalHarness:
         
         try:
             # Time the agent call
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             response = agent_fn(scenario.request, scenario.context)
-            end_time = time.perf_counter()
+            result.latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            result.latency_ms = (end_time - start_time) * 1000
             result.actual_action = response.selected_action
             result.reasoning = response.reasoning
             result.proposed_config = response.proposed_config
@@ -408,64 +468,86 @@ class EvalHarness:
     def run(
         self,
         agent_fn: Callable[[str, dict], AgentResponse],
-        verbose: bool = False
+        verbose: bool = False,
+        max_workers: int = 1
     ) -> EvalResults:
         """Run all scenarios and compute metrics.
         
         Args:
             agent_fn: Function that takes (request, context) and returns AgentResponse
             verbose: Print progress during evaluation
+            max_workers: Number of scenarios to run concurrently. Agent calls
+                are I/O-bound, so threads overlap the API round-trips.
             
         Returns:
             EvalResults with all metrics and details
         """
         results = EvalResults(
             timestamp=datetime.now().isoformat(),
-            git_sha=self.get_git_sha(),
-            prompt_hash=self.get_prompt_hash(),
+            git_sha=self._git_sha,
+            prompt_hash=self._prompt_hash,
             total_scenarios=len(self.scenarios)
         )
         
-        scenario_results = []
+        workers = max(1, min(max_workers, len(self.scenarios)))
         
-        for i, scenario in enumerate(self.scenarios):
+        if workers == 1:
+            scenario_results = []
+            
+            for i, scenario in enumerate(self.scenarios):
+                if verbose:
+                    print(f"Running scenario {i+1}/{len(self.scenarios)}: {scenario.request[:50]}...")
+                
+                result = self.run_scenario(scenario, i, agent_fn)
+                scenario_results.append(result)
+                
+                if verbose:
+                    status = "✓" if result.action_correct else "✗"
+                    print(f"  {status} Expected: {scenario.expected_action}, Got: {result.actual_action}")
+        else:
             if verbose:
-                print(f"Running scenario {i+1}/{len(self.scenarios)}: {scenario.request[:50]}...")
+                print(f"Running {len(self.scenarios)} scenarios with {workers} workers...")
             
-            result = self.run_scenario(scenario, i, agent_fn)
-            scenario_results.append(result)
+            # Futures are collected in submission order, so results keep
+            # their scenario_id order regardless of completion order
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.run_scenario, scenario, i, agent_fn)
+                    for i, scenario in enumerate(self.scenarios)
+                ]
+                scenario_results = [future.result() for future in futures]
             
             if verbose:
-                status = "✓" if result.action_correct else "✗"
-                print(f"  {status} Expected: {scenario.expected_action}, Got: {result.actual_action}")
+                for result in scenario_results:
+                    status = "✓" if result.action_correct else "✗"
+                    print(f"  {status} {result.request[:50]}: Expected: {result.expected_action}, Got: {result.actual_action}")
         
-        # Compute aggregate metrics
-        successful = [r for r in scenario_results if r.error is None]
+        # Compute aggregate metrics in a single pass
+        n_ok = n_action = n_liquid = n_json = n_error = 0
+        total_latency = 0.0
+        for r in scenario_results:
+            if r.error is not None:
+                n_error += 1
+                continue
+            n_ok += 1
+            n_action += r.action_correct
+            n_liquid += r.liquid_valid
+            n_json += r.renders_to_json
+            total_latency += r.latency_ms
         
         results.metrics = {
-            "action_accuracy": (
-                sum(1 for r in successful if r.action_correct) / len(successful) * 100
-                if successful else 0
-            ),
-            "liquid_valid": (
-                sum(1 for r in successful if r.liquid_valid) / len(successful) * 100
-                if successful else 0
-            ),
-            "renders_to_json": (
-                sum(1 for r in successful if r.renders_to_json) / len(successful) * 100
-                if successful else 0
-            ),
-            "avg_latency_ms": (
-                sum(r.latency_ms for r in successful) / len(successful)
-                if successful else 0
-            ),
-            "error_rate": (
-                sum(1 for r in scenario_results if r.error is not None) / len(scenario_results) * 100
-            )
+            "action_accuracy": n_action / n_ok * 100 if n_ok else 0,
+            "liquid_valid": n_liquid / n_ok * 100 if n_ok else 0,
+            "renders_to_json": n_json / n_ok * 100 if n_ok else 0,
+            "avg_latency_ms": total_latency / n_ok if n_ok else 0,
+            "error_rate": n_error / len(scenario_results) * 100
         }
         
         # Store detailed results
-        results.details = [asdict(r) for r in scenario_results]
+        results.details = [
+            {name: getattr(r, name) for name in _SCENARIO_FIELDS}
+            for r in scenario_results
+        ]
         
         return results
     
@@ -474,23 +556,62 @@ class EvalHarness:
         
         Args:
             results: The evaluation results to save
-            filename: Filename (e.g., "eval_v1.json")
+            filename: Filename (e.g., "eval_v1.json"). A ".jsonl" name is
+                written line-delimited via save_results_streaming.
             
         Returns:
             Path to the saved file
         """
+        if filename.endswith(".jsonl"):
+            return self.save_results_streaming(results, filename)
+        
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
         filepath = RESULTS_DIR / filename
         
-        with open(filepath, "w") as f:
-            json.dump(results.to_dict(), f, indent=2)
+        if orjson is not None:
+            # orjson serializes dataclasses natively, skipping asdict's deep copy
+            filepath.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(results.to_dict(), f, indent=2)
+        
+        return filepath
+    
+    def save_results_streaming(self, results: EvalResults, filename: str) -> Path:
+        """Save evaluation results as newline-delimited JSON.
+        
+        The first line holds the run metadata and metrics; each following
+        line is one scenario detail. Details are encoded and written one at
+        a time, so large eval sets never build the whole document in memory.
+        
+        Args:
+            results: The evaluation results to save
+            filename: Filename (e.g., "eval_v1.jsonl")
+            
+        Returns:
+            Path to the saved file
+        """
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        filepath = RESULTS_DIR / filename
+        
+        header = {name: getattr(results, name) for name in _RESULTS_HEADER_FIELDS}
+        with open(filepath, "wb") as f:
+            f.write(_json_line(header))
+            for detail in results.details:
+                f.write(_json_line(detail))
         
         return filepath
     
     @staticmethod
     def load_results(filepath: Path) -> dict:
-        """Load evaluation results from a file."""
-        with open(filepath) as f:
-            return json.load(f)
+        """Load evaluation results from a .json or line-delimited .jsonl file."""
+        if filepath.suffix != ".jsonl":
+            return _json_loads(filepath.read_bytes())
+        
+        with open(filepath, "rb") as f:
+            results = _json_loads(f.readline())
+            results["details"] = [_json_loads(line) for line in f if line.strip()]
+        return results
     
     @staticmethod
     def compare_results(baseline: dict, current: dict) -> dict:
@@ -591,6 +712,15 @@ def create_mock_agent() -> Callable[[str, dict], AgentResponse]:
     return mock_agent
 
 
+def _preload_agent_modules() -> None:
+    """Import the agent stack ahead of use (run in a background thread)."""
+    try:
+        import src.agent  # noqa: F401
+    except Exception:
+        # main() imports it again and reports the failure
+        pass
+
+
 def main():
     """CLI entry point for the eval harness."""
     parser = argparse.ArgumentParser(description="Run Integration Agent Evaluations")
@@ -627,9 +757,22 @@ def main():
         default=None,
         help="Override the model to use (e.g., gpt-4o, gpt-5)"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run N scenarios concurrently (default: 1 with --mock, 8 with --real)"
+    )
     
     args = parser.parse_args()
     
+    if args.real:
+        # Importing the agent stack takes about a second; start it now so it
+        # overlaps with harness setup and vector store initialization
+        preload = threading.Thread(target=_preload_agent_modules, daemon=True)
+        preload.start()
+    
     harness = EvalHarness()
     
     if args.compare:
@@ -650,7 +793,7 @@ def main():
     if args.mock:
         print("Running with mock agent...")
         agent_fn = create_mock_agent()
-        results = harness.run(agent_fn, verbose=args.verbose)
+        results = harness.run(agent_fn, verbose=args.verbose, max_workers=args.parallel or 1)
         harness.print_results(results)
         
         if args.output:
@@ -660,13 +803,14 @@ def main():
     elif args.real:
         print("Running with real Integration Agent...")
         try:
-            from src.agent import IntegrationAgent, get_agent_function
-            
             # Initialize the vector store first
             from src.vector_store import initialize_vector_store
             print("Initializing vector store...")
             initialize_vector_store()
             
+            preload.join()
+            from src.agent import IntegrationAgent, get_agent_function
+            
             # Create the agent
             agent = IntegrationAgent(
                 model=args.model,
@@ -677,7 +821,7 @@ def main():
             print(f"Using model: {agent.model_name}")
             print(f"Running {len(harness.scenarios)} scenarios...\n")
             
-            results = harness.run(agent_fn, verbose=args.verbose)
+            results = harness.run(agent_fn, verbose=args.verbose, max_workers=args.parallel or 8)
             harness.print_results(results)
             
             if args.output:
@@ -4,72 +4,123 @@ These tests verify the agent initialization, structured output handling,
 and integration with tools. Full integration tests require API access.
 """
 
+import asyncio
+import importlib
 import pytest
-import json
-from unittest.mock import Mock, patch, MagicMock
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 
+from src.agent import (
+    IntegrationAgent,
+    _get_llm,
+    _get_react_agent,
+    _get_structured_llm,
+    create_integration_agent,
+    get_agent_function,
+)
+from src.config import OPENAI_MODEL
 from src.models import AgentResponse, AgentResponseOutput, WorkflowContext
 
 
+class FakeStructuredLLM:
+    """Structured-output runnable stub returning (or raising) a fixed result."""
+    
+    def __init__(self, result):
+        self.result = result
+    
+    def invoke(self, *args, **kwargs):
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+class FakeLLM:
+    """ChatOpenAI stub whose structured-output runnable returns a fixed result."""
+    
+    def __init__(self, structured_result):
+        self.structured_llm = FakeStructuredLLM(structured_result)
+    
+    def with_structured_output(self, *args, **kwargs):
+        return self.structured_llm
+    
+    def bind_tools(self, *args, **kwargs):
+        return self
+
+
+class FakeReactAgent:
+    """Compiled ReAct graph stub whose final message has fixed content."""
+    
+    def __init__(self, content):
+        self.content = content
+    
+    def invoke(self, *args, **kwargs):
+        return {"messages": [SimpleNamespace(content=self.content)]}
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache(agent_deps):
+    """Reset the patched agent dependencies and clear the shared client/graph caches.
+    
+    The patches themselves live for the whole module (see conftest.py); each
+    test starts from fresh mocks and sets return values as it needs them.
+    """
+    agent_deps.llm.reset_mock(return_value=True, side_effect=True)
+    agent_deps.react.reset_mock(return_value=True, side_effect=True)
+    _get_llm.cache_clear()
+    _get_structured_llm.cache_clear()
+    _get_react_agent.cache_clear()
+    yield
+    _get_llm.cache_clear()
+    _get_structured_llm.cache_clear()
+    _get_react_agent.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def bare_agent():
+    """An IntegrationAgent skeleton, built without __init__, for its pure helpers."""
+    agent = IntegrationAgent.__new__(IntegrationAgent)
+    agent.model_name = "gpt-5"
+    agent.temperature = 0.2
+    agent.verbose = False
+    agent.tools = []
+    return agent
+
+
 class TestAgentImports:
     """Test that agent module imports correctly."""
     
     def test_can_import_agent_module(self):
         """Verify agent module can be imported."""
-        from src import agent
-        assert hasattr(agent, 'IntegrationAgent')
-        assert hasattr(agent, 'create_integration_agent')
-        assert hasattr(agent, 'get_agent_function')
-        assert hasattr(agent, 'run_agent')
+        agent = importlib.import_module("src.agent")
+        for name in ('IntegrationAgent', 'create_integration_agent', 'get_agent_function', 'run_agent'):
+            assert callable(getattr(agent, name))
     
     def test_can_import_agent_response_output(self):
-        """Verify AgentResponseOutput model is available."""
-        from src.models import AgentResponseOutput
-        assert AgentResponseOutput is not None
+        """Verify AgentResponseOutput model is available with the response fields."""
+        models = importlib.import_module("src.models")
+        fields = set(models.AgentResponseOutput.model_fields)
+        assert fields == {'selected_action', 'reasoning', 'proposed_config'}
 
 
 class TestAgentInputFormatting:
     """Test agent input formatting."""
     
-    def test_format_user_input_includes_request(self):
+    def test_format_user_input_includes_request(self, bare_agent):
         """Test that formatted input includes the user request."""
-        from src.agent import IntegrationAgent
-        
-        with patch('src.agent.ChatOpenAI'):
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = IntegrationAgent.__new__(IntegrationAgent)
-                    agent.model_name = "gpt-5"
-                    agent.temperature = 0.2
-                    agent.verbose = False
-                    agent.tools = []
-        
         request = "Post the summary to Slack"
         variables = {"summary": "Test summary", "slack_channel": "#test"}
         
-        formatted = agent._format_user_input(request, variables)
+        formatted = bare_agent._format_user_input(request, variables)
         
         assert "Post the summary to Slack" in formatted
-        assert "summary" in formatted
-        assert "slack_channel" in formatted
+        missing = {"summary", "slack_channel"} - set(re.findall(r"\w+", formatted))
+        assert not missing
     
-    def test_format_user_input_includes_variables(self):
+    def test_format_user_input_includes_variables(self, bare_agent):
         """Test that formatted input includes all variables."""
-        from src.agent import IntegrationAgent
-        
-        with patch('src.agent.ChatOpenAI'):
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = IntegrationAgent.__new__(IntegrationAgent)
-                    agent.model_name = "gpt-5"
-                    agent.temperature = 0.2
-                    agent.verbose = False
-                    agent.tools = []
-        
         request = "Test request"
         variables = {
             "var1": "value1",
@@ -77,13 +128,24 @@ class TestAgentInputFormatting:
             "var3": ["a", "b", "c"]
         }
         
-        formatted = agent._format_user_input(request, variables)
+        formatted = bare_agent._format_user_input(request, variables)
         
-        assert "var1" in formatted
-        assert "value1" in formatted
-        assert "var2" in formatted
-        assert "42" in formatted
-        assert "var3" in formatted
+        missing = {"var1", "value1", "var2", "42", "var3"} - set(re.findall(r"\w+", formatted))
+        assert not missing
+    
+    def test_build_messages_shares_static_system_message(self):
+        """Test that variables go in the user message, not the system prompt."""
+        agent = IntegrationAgent()
+        
+        variables = {"summary": "Test summary"}
+        first = agent._build_messages("Post to Slack", variables)
+        second = agent._build_messages("Create an issue", dict(variables))
+        third = agent._build_messages("Post to Slack", {"summary": "Other"})
+        
+        assert first[0] is second[0] is third[0]
+        assert "Test summary" not in first[0].content
+        assert "Test summary" in first[1].content
+        assert "Create an issue" in second[1].content
 
 
 class TestAgentFunctionWrapper:
@@ -91,24 +153,20 @@ class TestAgentFunctionWrapper:
     
     def test_get_agent_function_returns_callable(self):
         """Test that get_agent_function returns a callable."""
-        from src.agent import get_agent_function
-        
-        # Create a mock agent
-        mock_agent = Mock()
-        mock_agent.run.return_value = AgentResponse(
-            selected_action="test_action",
-            reasoning="test reasoning",
-            proposed_config="{}"
-        )
+        class FakeAgent:
+            def run(self, request, context):
+                return AgentResponse(
+                    selected_action="test_action",
+                    reasoning="test reasoning",
+                    proposed_config="{}"
+                )
         
-        agent_fn = get_agent_function(mock_agent)
+        agent_fn = get_agent_function(FakeAgent())
         
         assert callable(agent_fn)
     
     def test_agent_function_calls_agent_run(self):
         """Test that the wrapper function calls agent.run correctly."""
-        from src.agent import get_agent_function
-        
         mock_agent = Mock()
         mock_agent.run.return_value = AgentResponse(
             selected_action="slack_post_message",
@@ -128,103 +186,395 @@ class TestAgentFunctionWrapper:
 class TestStructuredOutput:
     """Test structured output handling."""
     
-    def test_structured_llm_generates_valid_response(self):
+    def test_structured_llm_generates_valid_response(self, agent_deps):
         """Test that structured LLM generates valid AgentResponseOutput."""
-        from src.agent import IntegrationAgent
-        
-        # Create mock structured output
-        mock_structured = AgentResponseOutput(
+        structured_output = AgentResponseOutput(
             selected_action="slack_post_message",
             reasoning="User wants to post to Slack",
             proposed_config='{"channel": "{{ slack_channel }}"}'
         )
         
-        # Create mock LLM with structured output
+        agent_deps.llm.return_value = FakeLLM(structured_output)
+        agent_deps.react.return_value = FakeReactAgent('I recommend using slack_post_message action.')
+        agent = IntegrationAgent()
+        
+        context = {"variables": {"slack_channel": "#test"}}
+        result = agent.run("Post to Slack", context)
+        
+        assert result.selected_action == "slack_post_message"
+        assert result.reasoning == "User wants to post to Slack"
+        assert result.proposed_config == '{"channel": "{{ slack_channel }}"}'
+    
+    def test_structured_output_handles_errors(self, agent_deps):
+        """Test that errors in structured output are handled gracefully."""
+        agent_deps.llm.return_value = FakeLLM(Exception("API error"))
+        agent_deps.react.return_value = FakeReactAgent('Analysis...')
+        agent = IntegrationAgent()
+        
+        context = {"variables": {}}
+        result = agent.run("Test request", context)
+        
+        # Should return error response, not crash
+        assert result.selected_action == "error"
+        assert "failed" in result.reasoning.lower()
+    
+    def test_agent_json_answer_skips_structured_llm(self, agent_deps):
+        """Test that a valid JSON final answer is used without a second LLM call."""
         mock_structured_llm = Mock()
-        mock_structured_llm.invoke.return_value = mock_structured
         
-        # Create mock ReAct agent result
-        mock_react_result = {
-            "messages": [
-                MagicMock(content='I recommend using slack_post_message action.')
-            ]
-        }
+        # Final answer in a fenced block; braces inside strings must not confuse parsing
+        final_answer = (
+            'Done.\n```json\n'
+            '{"selected_action": "slack_post_message", '
+            '"reasoning": "Post {message} to Slack", '
+            '"proposed_config": "{ \\"channel\\": \\"{{ slack_channel }}\\" }"}'
+            '\n```'
+        )
         mock_react_agent = Mock()
-        mock_react_agent.invoke.return_value = mock_react_result
+        mock_react_agent.invoke.return_value = {"messages": [SimpleNamespace(content=final_answer)]}
         
-        # Create mock LLM
         mock_llm = Mock()
         mock_llm.with_structured_output.return_value = mock_structured_llm
         
-        with patch('src.agent.validate_config'):
-            with patch('src.agent.ChatOpenAI', return_value=mock_llm):
-                with patch('src.agent.create_react_agent', return_value=mock_react_agent):
-                    agent = IntegrationAgent()
+        agent_deps.llm.return_value = mock_llm
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent()
         
-        context = {"variables": {"slack_channel": "#test"}}
-        result = agent.run("Post to Slack", context)
+        result = agent.run("Post to Slack", {"variables": {}})
         
         assert result.selected_action == "slack_post_message"
-        assert result.reasoning == "User wants to post to Slack"
-        assert result.proposed_config == '{"channel": "{{ slack_channel }}"}'
+        assert result.reasoning == "Post {message} to Slack"
+        assert result.proposed_config == '{ "channel": "{{ slack_channel }}" }'
+        mock_structured_llm.invoke.assert_not_called()
     
-    def test_structured_output_handles_errors(self):
-        """Test that errors in structured output are handled gracefully."""
-        from src.agent import IntegrationAgent
+    def test_answer_off_schema_falls_back_to_structured_llm(self, agent_deps):
+        """Test that a final answer missing schema fields goes to the structured LLM.
+        
+        Strict schema adherence isn't guaranteed with parallel tool calls on,
+        so the ReAct model's answer can't be trusted to match the schema.
+        """
+        structured_output = AgentResponseOutput(
+            selected_action="slack_post_message",
+            reasoning="Post to Slack",
+            proposed_config="{}"
+        )
+        agent_deps.llm.return_value = FakeLLM(structured_output)
+        agent_deps.react.return_value = FakeReactAgent('{"selected_action": "slack_post_message"}')
+        agent = IntegrationAgent()
+        
+        result = agent.run("Post to Slack", {"variables": {}})
+        
+        assert result.reasoning == "Post to Slack"
+        assert result.proposed_config == "{}"
+
+
+class TestResponseCache:
+    """Test reuse of responses for repeated identical requests."""
+    
+    def _make_agent(self, agent_deps, final_answer, **kwargs):
+        mock_react_agent = Mock()
+        mock_react_agent.invoke.return_value = {"messages": [SimpleNamespace(content=final_answer)]}
+        
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent(cache_responses=True, **kwargs)
+        return agent, mock_react_agent
+    
+    def test_cache_is_off_by_default(self, agent_deps):
+        """Test that a default agent always reaches the model."""
+        mock_react_agent = Mock()
+        mock_react_agent.invoke.return_value = {"messages": [SimpleNamespace(
+            content='{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )]}
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent()
+        
+        agent.run("Post to Slack", {"variables": {}})
+        agent.run("Post to Slack", {"variables": {}})
+        
+        assert mock_react_agent.invoke.call_count == 2
+    
+    def test_hits_get_a_fresh_trace(self, agent_deps):
+        """Test that a verbose cache hit reports the lookup, not the original run."""
+        answer = '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        agent, mock_react_agent = self._make_agent(agent_deps, answer, verbose=True)
+        mock_react_agent.invoke.return_value = {"messages": [AIMessage(content=answer)]}
+        
+        first = agent.run("Post to Slack", {"variables": {}})
+        first.trace.total_duration_ms = 12345.0
+        second = agent.run("Post to Slack", {"variables": {}})
+        
+        assert second.trace.total_duration_ms < 12345.0
+        assert [step.action for step in second.trace.steps] == ["Response cache hit"]
+        assert second.trace.tool_calls == []
+    
+    def test_repeated_request_skips_agent(self, agent_deps):
+        """Test that the same request and variables reuse the earlier response."""
+        agent, mock_react_agent = self._make_agent(
+            agent_deps,
+            '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )
+        
+        first = agent.run("Post to Slack", {"variables": {"x": 1}})
+        second = agent.run("Post to Slack", {"variables": {"x": 1}})
+        agent.run("Post to Slack", {"variables": {"x": 2}})
+        
+        assert second == first
+        assert mock_react_agent.invoke.call_count == 2
+    
+    def test_cached_responses_are_copies(self, agent_deps):
+        """Test that changing a returned response doesn't change later hits."""
+        agent, _ = self._make_agent(
+            agent_deps,
+            '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )
+        
+        first = agent.run("Post to Slack", {"variables": {}})
+        first.reasoning = "changed"
+        second = agent.run("Post to Slack", {"variables": {}})
+        
+        assert second is not first
+        assert second.reasoning == "b"
+    
+    def test_streaming_shares_cache(self, agent_deps):
+        """Test that run_streaming reuses responses and fills the cache."""
+        agent, mock_react_agent = self._make_agent(
+            agent_deps,
+            '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )
+        mock_react_agent.stream.return_value = iter([
+            ("messages", (AIMessageChunk(content='{"selected_action": "c", "reasoning": "d", "proposed_config": "{}"}', id="run-1"), {})),
+        ])
+        
+        agent.run("Post to Slack", {"variables": {}})
+        assert agent.run_streaming("Post to Slack", {"variables": {}}).selected_action == "a"
+        mock_react_agent.stream.assert_not_called()
+        
+        assert agent.run_streaming("Create an issue", {"variables": {}}).selected_action == "c"
+        assert agent.run("Create an issue", {"variables": {}}).selected_action == "c"
+        assert mock_react_agent.invoke.call_count == 1
+    
+    def test_bypass_cache_runs_agent(self, agent_deps):
+        """Test that bypass_cache always invokes the agent."""
+        agent, mock_react_agent = self._make_agent(
+            agent_deps,
+            '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )
+        
+        agent.run("Post to Slack", {"variables": {}})
+        agent.run("Post to Slack", {"variables": {}}, bypass_cache=True)
+        
+        assert mock_react_agent.invoke.call_count == 2
+    
+    def test_error_responses_are_not_cached(self, agent_deps):
+        """Test that a failed run is retried on the next identical request."""
+        agent, mock_react_agent = self._make_agent(agent_deps, "no answer")
+        agent.structured_llm = Mock()
+        agent.structured_llm.invoke.side_effect = Exception("API error")
+        
+        assert agent.run("Post to Slack", {"variables": {}}).selected_action == "error"
+        agent.run("Post to Slack", {"variables": {}})
+        
+        assert mock_react_agent.invoke.call_count == 2
+
+
+class TestAgentBatch:
+    """Test concurrent batch execution."""
+    
+    def test_run_batch_returns_responses_in_order(self, agent_deps):
+        """Test that run_batch runs every request and preserves order."""
+        async def fake_structured(prompt):
+            action = "slack_post_message" if "Slack" in prompt else "github_create_issue"
+            return AgentResponseOutput(
+                selected_action=action,
+                reasoning="test",
+                proposed_config="{}"
+            )
         
-        # Create mock structured LLM that raises an error
         mock_structured_llm = Mock()
-        mock_structured_llm.invoke.side_effect = Exception("API error")
+        mock_structured_llm.ainvoke = AsyncMock(side_effect=fake_structured)
         
-        # Create mock ReAct agent result
-        mock_react_result = {"messages": [MagicMock(content='Analysis...')]}
         mock_react_agent = Mock()
-        mock_react_agent.invoke.return_value = mock_react_result
+        mock_react_agent.ainvoke = AsyncMock(return_value={"messages": [SimpleNamespace(content='OK')]})
         
-        # Create mock LLM
         mock_llm = Mock()
         mock_llm.with_structured_output.return_value = mock_structured_llm
         
-        with patch('src.agent.validate_config'):
-            with patch('src.agent.ChatOpenAI', return_value=mock_llm):
-                with patch('src.agent.create_react_agent', return_value=mock_react_agent):
-                    agent = IntegrationAgent()
+        agent_deps.llm.return_value = mock_llm
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent()
         
-        context = {"variables": {}}
-        result = agent.run("Test request", context)
+        results = agent.run_batch([
+            ("Post to Slack", {"variables": {}}),
+            ("Create a GitHub issue", {"variables": {}}),
+        ])
         
-        # Should return error response, not crash
-        assert result.selected_action == "error"
-        assert "failed" in result.reasoning.lower()
+        assert [r.selected_action for r in results] == ["slack_post_message", "github_create_issue"]
+        assert mock_react_agent.ainvoke.await_count == 2
+    
+    def test_run_batch_limits_concurrency_to_batch_size(self, agent_deps):
+        """Test that no more than batch_size requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_ainvoke(state):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            request = state["messages"][1].content
+            action = "a" + request.split("Request #")[1].split()[0]
+            answer = f'{{"selected_action": "{action}", "reasoning": "r", "proposed_config": "{{}}"}}'
+            return {"messages": [SimpleNamespace(content=answer)]}
+        
+        mock_react_agent = Mock()
+        mock_react_agent.ainvoke = fake_ainvoke
+        
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent()
+        
+        items = [(f"Request #{i} please", {"variables": {}}) for i in range(5)]
+        results = agent.run_batch(items, batch_size=2)
+        
+        assert [r.selected_action for r in results] == [f"a{i}" for i in range(5)]
+        assert peak == 2
+    
+    def test_run_batch_inside_event_loop_raises(self, agent_deps):
+        """Test that run_batch points async callers at arun_batch."""
+        agent = IntegrationAgent()
+        
+        async def call_from_loop():
+            with pytest.raises(RuntimeError, match="arun_batch"):
+                agent.run_batch([("Post to Slack", {"variables": {}})])
+        
+        asyncio.run(call_from_loop())
 
 
-class TestWorkflowContextIntegration:
-    """Test WorkflowContext integration."""
+class TestAgentStreaming:
+    """Test streaming execution."""
     
-    def test_run_with_workflow_context(self):
-        """Test running agent with WorkflowContext object."""
-        from src.agent import IntegrationAgent
+    def _make_agent(self, agent_deps, stream_items, mock_structured_llm=None):
+        mock_react_agent = Mock()
+        mock_react_agent.stream.return_value = iter(stream_items)
         
-        mock_structured = AgentResponseOutput(
-            selected_action="slack_post_message",
+        mock_llm = Mock()
+        mock_llm.with_structured_output.return_value = mock_structured_llm or Mock()
+        
+        agent_deps.llm.return_value = mock_llm
+        agent_deps.react.return_value = mock_react_agent
+        return IntegrationAgent()
+    
+    def test_run_streaming_returns_once_answer_is_complete(self, agent_deps):
+        """Test that streaming stops consuming chunks after a valid answer."""
+        pieces = [
+            'Here you go: {"selected_action": "slack_post_message", ',
+            '"reasoning": "Post it", ',
+            '"proposed_config": "{ \\"text\\": \\"{{ summary }}\\" }"}',
+            " trailing text",
+        ]
+        consumed = []
+        
+        def stream_items():
+            for piece in pieces:
+                consumed.append(piece)
+                yield ("messages", (AIMessageChunk(content=piece, id="run-1"), {}))
+        
+        agent = self._make_agent(agent_deps, stream_items())
+        result = agent.run_streaming("Post to Slack", {"variables": {}})
+        
+        assert result.selected_action == "slack_post_message"
+        assert result.proposed_config == '{ "text": "{{ summary }}" }'
+        assert consumed == pieces[:3]
+    
+    def test_run_streaming_falls_back_to_structured_llm(self, agent_deps):
+        """Test that a streamed answer without valid JSON uses the structured LLM."""
+        mock_structured_llm = Mock()
+        mock_structured_llm.invoke.return_value = AgentResponseOutput(
+            selected_action="github_create_issue",
             reasoning="test",
             proposed_config="{}"
         )
+        stream_items = [
+            ("messages", (AIMessageChunk(content="Use github_create_issue.", id="run-1"), {})),
+            ("values", {"messages": [AIMessage(content="Use github_create_issue.")]}),
+        ]
         
-        mock_structured_llm = Mock()
-        mock_structured_llm.invoke.return_value = mock_structured
+        agent = self._make_agent(agent_deps, stream_items, mock_structured_llm)
+        result = agent.run_streaming("Create an issue", {"variables": {}})
+        
+        assert result.selected_action == "github_create_issue"
+        prompt = mock_structured_llm.invoke.call_args[0][0]
+        assert "Use github_create_issue." in prompt
+    
+    def test_arun_streaming_returns_once_answer_is_complete(self, agent_deps):
+        """Test the async streaming path parses the answer the same way."""
+        async def astream_items(*args, **kwargs):
+            yield ("messages", (ToolMessage(content='{"not": "the answer"}', tool_call_id="1"), {}))
+            yield ("messages", (AIMessageChunk(content='{"selected_action": "a", "reasoning": "b", ', id="run-1"), {}))
+            yield ("messages", (AIMessageChunk(content='"proposed_config": "{}"}', id="run-1"), {}))
+            raise AssertionError("stream consumed past the answer")
         
-        mock_react_result = {"messages": [MagicMock(content='OK')]}
         mock_react_agent = Mock()
-        mock_react_agent.invoke.return_value = mock_react_result
+        mock_react_agent.astream = astream_items
         
-        mock_llm = Mock()
-        mock_llm.with_structured_output.return_value = mock_structured_llm
+        agent_deps.react.return_value = mock_react_agent
+        agent = IntegrationAgent()
+        
+        result = asyncio.run(agent.arun_streaming("Do it", {"variables": {}}))
+        
+        assert result.selected_action == "a"
+
+
+class TestTraceExtraction:
+    """Test trace reconstruction from LangGraph messages."""
+    
+    def test_extract_trace_pairs_tool_calls_with_observations(self):
+        """Test that tool outputs are attached to the step that called the tool."""
+        agent = IntegrationAgent(verbose=True)
+        
+        messages = [
+            HumanMessage(content="Post to Slack"),
+            AIMessage(content="", tool_calls=[
+                {"name": "retrieve_api_documentation", "args": {"action_id": "slack_post_message"}, "id": "call_1"}
+            ]),
+            ToolMessage(content="x" * 600, tool_call_id="call_1", name="retrieve_api_documentation"),
+            AIMessage(content="Final answer"),
+        ]
+        
+        trace = agent._extract_trace(messages, 42.0)
+        
+        assert [s.step_number for s in trace.steps] == [1, 2]
+        assert trace.steps[0].action == "Call tool: retrieve_api_documentation"
+        assert trace.steps[0].observation == "x" * 500 + "..."
+        assert trace.steps[1].action == "Final Answer"
+        assert trace.tool_calls[0].tool_input == {"action_id": "slack_post_message"}
+        assert trace.total_duration_ms == 42.0
+    
+    def test_extract_trace_handles_unmatched_tool_message(self):
+        """Test that a tool result without a matching call is still recorded."""
+        agent = IntegrationAgent(verbose=True)
+        
+        messages = [ToolMessage(content="orphan", tool_call_id="missing", name="get_available_actions")]
+        
+        trace = agent._extract_trace(messages, 1.0)
         
-        with patch('src.agent.validate_config'):
-            with patch('src.agent.ChatOpenAI', return_value=mock_llm):
-                with patch('src.agent.create_react_agent', return_value=mock_react_agent):
-                    agent = IntegrationAgent()
+        assert trace.steps == []
+        assert trace.tool_calls[0].tool_input == {}
+        assert trace.tool_calls[0].tool_output == "orphan"
+
+
+class TestWorkflowContextIntegration:
+    """Test WorkflowContext integration."""
+    
+    def test_run_with_workflow_context(self, agent_deps):
+        """Test running agent with WorkflowContext object."""
+        agent_deps.llm.return_value = FakeLLM(AgentResponseOutput(
+            selected_action="slack_post_message",
+            reasoning="test",
+            proposed_config="{}"
+        ))
+        agent_deps.react.return_value = FakeReactAgent('OK')
+        agent = IntegrationAgent()
         
         workflow_context = WorkflowContext(
             user_input="Post to Slack",
@@ -241,40 +591,67 @@ class TestAgentConfiguration:
     
     def test_agent_stores_temperature_setting(self):
         """Test that agent stores the provided temperature."""
-        from src.agent import IntegrationAgent
-        
-        with patch('src.agent.ChatOpenAI') as mock_llm:
-            mock_llm.return_value.with_structured_output.return_value = Mock()
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = IntegrationAgent(temperature=0.5)
+        agent = IntegrationAgent(temperature=0.5)
         
         assert agent.temperature == 0.5
     
     def test_agent_uses_default_model(self):
         """Test that agent uses the configured default model."""
-        from src.agent import IntegrationAgent
-        from src.config import OPENAI_MODEL
-        
-        with patch('src.agent.ChatOpenAI') as mock_llm:
-            mock_llm.return_value.with_structured_output.return_value = Mock()
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = IntegrationAgent()
+        agent = IntegrationAgent()
         
         assert agent.model_name == OPENAI_MODEL
     
     def test_agent_allows_custom_model(self):
         """Test that agent accepts a custom model."""
-        from src.agent import IntegrationAgent
-        
-        with patch('src.agent.ChatOpenAI') as mock_llm:
-            mock_llm.return_value.with_structured_output.return_value = Mock()
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = IntegrationAgent(model="gpt-4-turbo")
+        agent = IntegrationAgent(model="gpt-4-turbo")
         
         assert agent.model_name == "gpt-4-turbo"
+    
+    def test_agents_with_same_settings_share_llm(self, agent_deps):
+        """Test that ChatOpenAI is constructed once per model/temperature."""
+        first = IntegrationAgent(model="gpt-4o", temperature=0.2)
+        second = IntegrationAgent(model="gpt-4o", temperature=0.2)
+        IntegrationAgent(model="gpt-4o", temperature=0.5)
+        
+        assert first.llm is second.llm
+        assert agent_deps.llm.call_count == 2
+    
+    def test_agents_with_same_settings_share_compiled_graph(self, agent_deps):
+        """Test that the ReAct graph is compiled once per model/temperature."""
+        first = IntegrationAgent(model="gpt-4o")
+        second = IntegrationAgent(model="gpt-4o")
+        
+        assert first.agent is second.agent
+        agent_deps.react.assert_called_once()
+    
+    def test_structured_llm_is_strict_and_shared(self, agent_deps):
+        """Test that the structured-output runnable is built once, in strict json_schema mode."""
+        mock_llm = Mock()
+        
+        agent_deps.llm.return_value = mock_llm
+        first = IntegrationAgent(model="gpt-4o")
+        second = IntegrationAgent(model="gpt-4o")
+        
+        assert first.structured_llm is second.structured_llm
+        mock_llm.with_structured_output.assert_called_once_with(
+            AgentResponseOutput, method="json_schema", strict=True
+        )
+    
+    def test_react_model_constrains_final_answer_to_schema(self, agent_deps):
+        """Test that the ReAct model is bound with the AgentResponseOutput schema."""
+        mock_llm = Mock()
+        
+        agent_deps.llm.return_value = mock_llm
+        agent = IntegrationAgent()
+        
+        _, kwargs = mock_llm.bind_tools.call_args
+        assert kwargs["parallel_tool_calls"] is True
+        schema = kwargs["response_format"]["json_schema"]
+        assert schema["strict"] is True
+        assert set(schema["schema"]["required"]) == {"selected_action", "reasoning", "proposed_config"}
+        create_kwargs = agent_deps.react.call_args.kwargs
+        assert create_kwargs["model"] is mock_llm.bind_tools.return_value
+        assert create_kwargs["tools"] is agent.tools
 
 
 class TestCreateAgentFactory:
@@ -282,29 +659,17 @@ class TestCreateAgentFactory:
     
     def test_create_agent_returns_integration_agent(self):
         """Test that create_integration_agent returns an IntegrationAgent instance."""
-        from src.agent import create_integration_agent, IntegrationAgent
-        
-        with patch('src.agent.ChatOpenAI') as mock_llm:
-            mock_llm.return_value.with_structured_output.return_value = Mock()
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = create_integration_agent()
+        agent = create_integration_agent()
         
         assert isinstance(agent, IntegrationAgent)
     
     def test_create_agent_passes_arguments(self):
         """Test that create_integration_agent passes arguments correctly."""
-        from src.agent import create_integration_agent
-        
-        with patch('src.agent.ChatOpenAI') as mock_llm:
-            mock_llm.return_value.with_structured_output.return_value = Mock()
-            with patch('src.agent.validate_config'):
-                with patch('src.agent.create_react_agent'):
-                    agent = create_integration_agent(
-                        model="gpt-4",
-                        temperature=0.8,
-                        verbose=True
-                    )
+        agent = create_integration_agent(
+            model="gpt-4",
+            temperature=0.8,
+            verbose=True
+        )
         
         assert agent.model_name == "gpt-4"
         assert agent.temperature == 0.8
@@ -344,7 +709,3 @@ class TestAgentResponseOutputModel:
         assert response.reasoning == output.reasoning
         assert response.proposed_config == output.proposed_config
         assert response.trace is None  # No trace by default
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+"""Tests for the Integration Agent CLI."""
+
+import pytest
+from unittest.mock import patch
+import sys
+
+import cli
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace so argparse line wrapping doesn't matter."""
+    return " ".join(text.split())
+
+
+class TestHelpText:
+    """Tests for the precomputed --help fast path."""
+
+    def test_help_text_matches_parser_output(self, monkeypatch):
+        """Test that HELP_TEXT is exactly argparse's rendering at 80 columns."""
+        monkeypatch.setenv("COLUMNS", "80")
+
+        assert cli.HELP_TEXT == cli.build_parser().format_help()
+
+    def test_help_text_lists_every_option(self):
+        """Test that HELP_TEXT mentions every flag the parser accepts."""
+        parser = cli.build_parser()
+
+        for action in parser._actions:
+            for option in action.option_strings:
+                assert option in cli.HELP_TEXT
+
+    def test_help_text_matches_option_descriptions(self):
+        """Test that HELP_TEXT carries the parser's current help strings."""
+        parser = cli.build_parser()
+        help_text = _normalize(cli.HELP_TEXT)
+
+        for action in parser._actions:
+            if action.help:
+                assert _normalize(action.help) in help_text
+
+    def test_help_flag_exits_without_building_parser(self, capsys, monkeypatch):
+        """Test that --help prints the parser's help and exits cleanly."""
+        monkeypatch.setenv("COLUMNS", "80")
+        expected = cli.build_parser().format_help()
+
+        with patch.object(sys, "argv", ["cli.py", "--help"]):
+            with patch.object(cli, "build_parser") as mock_build_parser:
+                with pytest.raises(SystemExit) as exc:
+                    cli.main()
+
+        assert exc.value.code == 0
+        mock_build_parser.assert_not_called()
+        assert capsys.readouterr().out == expected
+
+
+class TestParseValue:
+    """Tests for parsing interactive `set` values."""
+
+    def test_json_containers_are_not_shared(self):
+        """Test that the same JSON literal parsed twice gives independent objects."""
+        first = cli._parse_value('{"tags": ["a"]}')
+        first["tags"].append("b")
+
+        assert cli._parse_value('{"tags": ["a"]}') == {"tags": ["a"]}
+
+    def test_non_json_falls_back_to_string(self):
+        """Test that text that isn't JSON is kept as-is."""
+        assert cli._parse_value("#alerts") == "#alerts"
@@ -0,0 +1,100 @@
+"""Tests for parsing the agent's final JSON answer."""
+
+import pytest
+
+from src.response_parser import StreamingResponseParser, iter_json_spans, parse_response
+
+
+class TestIterJsonSpans:
+    """Tests for the single-pass brace scanner."""
+
+    def test_ignores_braces_inside_strings(self):
+        """Test that braces and escaped quotes inside strings don't end an object."""
+        text = 'before {"a": "}\\"{"} middle {"b": {"c": 1}} after'
+
+        spans = [text[start:end] for start, end in iter_json_spans(text)]
+
+        assert spans == ['{"a": "}\\"{"}', '{"b": {"c": 1}}']
+
+    def test_unbalanced_object_yields_nothing(self):
+        """Test that a truncated object is not reported."""
+        assert list(iter_json_spans('{"a": {"b": 1}')) == []
+
+
+class TestParseResponse:
+    """Tests for parse_response."""
+
+    def test_parses_fenced_answer_with_liquid_config(self):
+        """Test parsing a fenced JSON answer whose config contains Liquid tags."""
+        output = (
+            "I'll post the summary.\n```json\n"
+            '{"selected_action": "slack_post_message", '
+            '"reasoning": "Post it", '
+            '"proposed_config": "{ \\"channel\\": \\"{{ slack_channel }}\\" }"}'
+            "\n```"
+        )
+
+        result = parse_response(output)
+
+        assert result.selected_action == "slack_post_message"
+        assert result.proposed_config == '{ "channel": "{{ slack_channel }}" }'
+
+    def test_skips_objects_that_do_not_match_schema(self):
+        """Test that earlier non-matching objects are skipped."""
+        output = (
+            '{"action_id": "slack_post_message"} then '
+            '{"selected_action": "a", "reasoning": "b", "proposed_config": "{}"}'
+        )
+
+        assert parse_response(output).selected_action == "a"
+
+    def test_returns_none_without_valid_answer(self):
+        """Test that prose or invalid JSON returns None."""
+        assert parse_response("I recommend slack_post_message.") is None
+        assert parse_response("{not: json}") is None
+
+
+class TestStreamingResponseParser:
+    """Tests for incremental parsing of streamed chunks."""
+
+    def test_returns_answer_once_object_closes(self):
+        """Test that the answer is returned on the chunk that completes it."""
+        parser = StreamingResponseParser()
+        chunks = [
+            '{"selected_action": "a", ',
+            '"reasoning": "uses {{ x }}", ',
+            '"proposed_config": "{}"}',
+        ]
+
+        results = [parser.feed("msg-1", chunk) for chunk in chunks]
+
+        assert results[:2] == [None, None]
+        assert results[2].selected_action == "a"
+
+    def test_unbalanced_brace_inside_string_is_ignored(self):
+        """Test that a lone brace in a string value doesn't hold back the answer."""
+        parser = StreamingResponseParser()
+        chunks = [
+            '{"selected_action": "a", "reasoning": "use {x", ',
+            '"proposed_config": "{}"}',
+            ' Done.',
+        ]
+
+        results = [parser.feed("msg-1", chunk) for chunk in chunks]
+
+        assert results[0] is None
+        assert results[1].reasoning == "use {x"
+
+    def test_new_message_id_resets_buffer(self):
+        """Test that text from an earlier turn is not merged into the next."""
+        parser = StreamingResponseParser()
+
+        assert parser.feed("msg-1", '{"selected_action": "a", ') is None
+        assert parser.feed("msg-2", '"reasoning": "b", "proposed_config": "{}"}') is None
+
+    def test_ignores_non_string_content(self):
+        """Test that empty or structured (list) content is skipped."""
+        parser = StreamingResponseParser()
+
+        assert parser.feed("msg-1", "") is None
+        assert parser.feed("msg-1", [{"type": "text", "text": "{}"}]) is None
@@ -0,0 +1,253 @@
+"""Tests for the ChromaDB vector store (offline, with fake embeddings)."""
+
+import shutil
+import sys
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+import src.vector_store as vector_store
+from src.vector_store import VectorStore
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Deterministic fake embeddings that record every embedded text."""
+    
+    embedded: list = []
+    
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+    
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    """Copy of the API docs that tests may edit."""
+    path = tmp_path / "api_docs"
+    shutil.copytree(vector_store.API_DOCS_DIR, path)
+    return path
+
+
+@pytest.fixture
+def make_store(tmp_path, docs_dir):
+    """Factory for stores sharing one persist directory and fake embeddings."""
+    embeddings = CountingEmbeddings(size=16, embedded=[])
+    
+    with patch.object(vector_store, "API_DOCS_DIR", docs_dir):
+        with patch.object(vector_store, "_get_embeddings", return_value=embeddings):
+            yield lambda: VectorStore(persist_directory=tmp_path / "chroma")
+
+
+class TestChunking:
+    """Tests for splitting docs into chunks."""
+    
+    def test_code_block_indentation_survives(self):
+        """Test that fenced JSON keeps its indentation and '#' lines in it aren't headers."""
+        text = (
+            "# Example API\n\n## Request Body\n\n```json\n{\n  \"fields\": {\n"
+            "    \"Name\": \"Widget\"\n  }\n}\n```\n\n```bash\n# not a header\n```\n"
+        )
+        doc = Document(page_content=text, metadata={"integration": "example", "file_name": "example.md"})
+        
+        chunks = VectorStore()._chunk_documents([doc])
+        
+        assert len(chunks) == 2
+        assert '{\n  "fields": {\n    "Name": "Widget"\n  }\n}' in chunks[1].page_content
+        assert "# not a header" in chunks[1].page_content
+        assert chunks[1].metadata["h2"] == "Request Body"
+
+
+class TestIncrementalIndexing:
+    """Tests for re-indexing only changed files."""
+    
+    def test_unchanged_docs_are_not_reembedded(self, make_store):
+        """Test that a second initialize loads the index without embedding."""
+        store = make_store()
+        count = store.initialize()
+        embedded = len(store.embeddings.embedded)
+        
+        assert make_store().initialize() == count
+        assert len(store.embeddings.embedded) == embedded
+    
+    def test_only_changed_file_is_reindexed(self, make_store, docs_dir):
+        """Test that editing one file embeds only its new chunk text."""
+        store = make_store()
+        store.initialize()
+        store.embeddings.embedded.clear()
+        
+        slack_doc = docs_dir / "slack.md"
+        slack_doc.write_text(slack_doc.read_text() + "\n## Rate Limits\nOne message per second.\n")
+        store = make_store()
+        store.initialize()
+        
+        assert store.embeddings.embedded
+        assert all("One message per second" in text for text in store.embeddings.embedded)
+        assert any(
+            "One message per second" in doc.page_content
+            for doc in store.search("rate limits", k=20, filter_integration="slack")
+        )
+    
+    def test_only_changed_file_is_loaded(self, make_store, docs_dir):
+        """Test that re-indexing reads just the edited file and numbers its chunks from 0."""
+        make_store().initialize()
+        
+        slack_doc = docs_dir / "slack.md"
+        slack_doc.write_text(slack_doc.read_text() + "\n## Rate Limits\nOne message per second.\n")
+        store = make_store()
+        with patch.object(store, "_chunk_documents", wraps=store._chunk_documents) as chunk_documents:
+            store.initialize()
+        
+        documents = chunk_documents.call_args.args[0]
+        assert [doc.metadata["file_name"] for doc in documents] == ["slack.md"]
+        metadatas = store._vectorstore._collection.get(where={"file_name": "slack.md"})["metadatas"]
+        assert sorted(m["chunk_index"] for m in metadatas) == list(range(len(metadatas)))
+    
+    def test_deleted_file_chunks_are_removed(self, make_store, docs_dir):
+        """Test that chunks of a deleted file leave the index."""
+        make_store().initialize()
+        
+        (docs_dir / "github.md").unlink()
+        store = make_store()
+        store.initialize()
+        
+        assert store.search("create issue", k=5, filter_integration="github") == []
+    
+    def test_identical_chunks_are_stored_once(self, make_store, docs_dir):
+        """Test that repeated sections share one index entry, even across rebuilds."""
+        slack_doc = docs_dir / "slack.md"
+        section = "\n## Rate Limits\nOne message per second.\n"
+        slack_doc.write_text(slack_doc.read_text() + section + section)
+        store = make_store()
+        store.initialize()
+        store.initialize(force_rebuild=True)
+        
+        stored = store._vectorstore._collection.get(where={"file_name": "slack.md"})["documents"]
+        assert sum("One message per second" in text for text in stored) == 1
+    
+    def test_chunk_id_metadata_is_the_record_id(self, make_store):
+        """Test that each stored chunk's chunk_id metadata matches its Chroma ID."""
+        store = make_store()
+        store.initialize()
+        
+        stored = store._vectorstore._collection.get()
+        assert stored["ids"]
+        assert [m["chunk_id"] for m in stored["metadatas"]] == stored["ids"]
+    
+    def test_force_rebuild_reuses_cached_embeddings(self, make_store):
+        """Test that a forced rebuild takes vectors from the embedding cache."""
+        store = make_store()
+        count = store.initialize()
+        store.embeddings.embedded.clear()
+        
+        assert make_store().initialize(force_rebuild=True) == count
+        assert store.embeddings.embedded == []
+
+
+class TestDistanceSpace:
+    """Tests for the collection's cosine distance space."""
+    
+    def test_scores_are_cosine_distances(self, make_store):
+        """Test that search_with_scores returns cosine distances (0 for identical text)."""
+        store = make_store()
+        store.initialize()
+        chunk = store._vectorstore._collection.get(limit=1)["documents"][0]
+        
+        results = store.search_with_scores(chunk, k=5)
+        
+        assert results[0][0].page_content == chunk
+        assert results[0][1] == pytest.approx(0.0, abs=1e-5)
+        assert all(-1e-5 <= score <= 2.0 for _, score in results)
+    
+    def test_collection_with_other_space_is_recreated(self, make_store):
+        """Test that an index created with L2 distance is rebuilt as cosine."""
+        with patch.object(vector_store, "_HNSW_CONFIG", {"hnsw": {"space": "l2"}}):
+            count = make_store().initialize()
+        
+        store = make_store()
+        assert store.initialize() == count
+        assert store._vectorstore._collection.configuration_json["hnsw"]["space"] == "cosine"
+
+
+class TestQueryCache:
+    """Tests for caching of repeated searches."""
+    
+    def test_repeated_search_skips_index(self, make_store):
+        """Test that an identical search is served from the cache."""
+        store = make_store()
+        store.initialize()
+        
+        first = store.search("post a message", k=2, filter_integration="slack")
+        with patch.object(store._vectorstore, "similarity_search") as mock_search:
+            second = store.search("post a message", k=2, filter_integration="slack")
+        
+        mock_search.assert_not_called()
+        assert second == first
+    
+    def test_cached_documents_are_copies(self, make_store):
+        """Test that editing returned Documents doesn't change later hits."""
+        store = make_store()
+        store.initialize()
+        
+        first = store.search("post a message", k=2, filter_integration="slack")
+        first[0].metadata["integration"] = "changed"
+        first[0].page_content = "changed"
+        scored = store.search_with_scores("post a message", k=2)
+        scored[0][0].metadata["integration"] = "changed"
+        
+        second = store.search("post a message", k=2, filter_integration="slack")
+        assert second[0].metadata["integration"] == "slack"
+        assert second[0].page_content != "changed"
+        assert store.search_with_scores("post a message", k=2)[0][0].metadata["integration"] != "changed"
+    
+    def test_batch_search_matches_single_searches(self, make_store):
+        """Test that batch_search embeds all queries at once and returns per-query results."""
+        store = make_store()
+        store.initialize()
+        queries = ["post a message", "create a contact"]
+        
+        store.embeddings.embedded.clear()
+        
+        batched = store.batch_search(queries, k=3)
+        
+        assert store.embeddings.embedded == queries
+        for query, docs in zip(queries, batched):
+            assert [doc.page_content for doc in docs] == [
+                doc.page_content for doc in store.search(query, k=3)
+            ]
+    
+    def test_concurrent_expiry_is_safe(self, make_store):
+        """Test that threads expiring and evicting the same entries don't race."""
+        store = make_store()
+        
+        def churn(worker):
+            results = [Document(page_content=str(worker))]
+            for i in range(2000):
+                key = ("search", str(i % 8), 4, None)
+                store._cache_query(key, results)
+                store._cached_query(key)
+        
+        # Switch threads as often as possible so unguarded races surface
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with patch.object(vector_store, "_QUERY_CACHE_TTL", -1.0), patch.object(vector_store, "_QUERY_CACHE_SIZE", 4):
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    list(pool.map(churn, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+    
+    def test_initialize_clears_cache(self, make_store):
+        """Test that results cached before a re-initialize are dropped."""
+        store = make_store()
+        store.initialize()
+        store.search("post a message", k=2)
+        
+        store.initialize()
+        
+        assert not store._query_cache
@@ -6,24 +6,67 @@ information and generating configurations.
 Tools:
 - get_available_actions: List all available integration actions
 - retrieve_api_documentation: Get API docs for a specific action
+
+Call warmup() at process startup to pay the initialization cost before
+the first request instead of during it, and cache_clear_all() after
+editing the catalog or rebuilding the vector store.
 """
 
 from tools.get_actions import (
+    _actions_by_id,
+    _load_actions,
+    _public_actions,
+    _query_pattern,
+    _search_blobs,
     get_available_actions,
     get_actions_for_prompt,
     get_action_by_id,
     validate_action_id,
 )
 from tools.retrieve_docs import (
+    _ensure_initialized,
+    _retrieve_documentation,
     retrieve_api_documentation,
     get_documentation_for_action,
+    retrieve_documentation_batch,
 )
 
-# All LangChain tools for the agent
-AGENT_TOOLS = [
+# All LangChain tools for the agent (a tuple: shared by every compiled graph)
+AGENT_TOOLS = (
     get_available_actions,
     retrieve_api_documentation,
-]
+)
+
+
+def warmup() -> None:
+    """Load the vector store and the action catalog ahead of the first request.
+    
+    Both are otherwise initialized lazily by the first tool call, which
+    then pays for opening the index and parsing the catalog.
+    """
+    _ensure_initialized()
+    _actions_by_id()
+    _public_actions()
+    _search_blobs()
+
+
+def cache_clear_all() -> None:
+    """Clear every memoized catalog and documentation lookup in the tools.
+    
+    The caches assume the action catalog and the vector store are static,
+    so call this after changing either (tests do, around every test).
+    """
+    for cached in (
+        _load_actions,
+        _actions_by_id,
+        _public_actions,
+        _search_blobs,
+        _query_pattern,
+        get_actions_for_prompt,
+        _retrieve_documentation,
+    ):
+        cached.cache_clear()
+
 
 __all__ = [
     # LangChain tools
@@ -35,4 +78,7 @@ __all__ = [
     "get_action_by_id",
     "validate_action_id",
     "get_documentation_for_action",
+    "retrieve_documentation_batch",
+    "warmup",
+    "cache_clear_all",
 ]
@@ -5,23 +5,100 @@ actions so it can select the most appropriate one for the user's request.
 """
 
 import json
-from pathlib import Path
+import re
+from functools import lru_cache
 from typing import Optional
 
 from langchain_core.tools import tool
 
-# Add project root to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
 from src.config import DATA_DIR
 
 
+def _to_json(obj, indent: bool = False) -> str:
+    """Serialize a tool response with orjson when available, else the stdlib.
+    
+    Args:
+        obj: JSON-serializable response
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _from_json(data: str | bytes):
+    """Parse JSON with orjson when available, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Catalog fields used internally (search filters) and kept out of tool output
+_INTERNAL_FIELDS = frozenset({"integration"})
+
+
+def _public_view(action: dict) -> dict:
+    """Copy of an action without _INTERNAL_FIELDS, as shown to the LLM."""
+    return {key: value for key, value in action.items() if key not in _INTERNAL_FIELDS}
+
+
+@lru_cache(maxsize=1)
 def _load_actions() -> list[dict]:
-    """Load integration actions from the JSON catalog."""
+    """Load integration actions from the JSON catalog.
+    
+    The catalog is static at runtime, so it is read and parsed once per
+    process and the same list is shared by every caller (treat it as
+    read-only). Call ``tools.cache_clear_all()`` to re-read the file.
+    """
     actions_file = DATA_DIR / "actions.json"
-    with open(actions_file) as f:
-        return json.load(f)
+    return _from_json(actions_file.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _actions_by_id() -> dict[str, dict]:
+    """Index the actions catalog by action ID (clear alongside _load_actions)."""
+    return {action["id"]: action for action in _load_actions()}
+
+
+@lru_cache(maxsize=1)
+def _public_actions() -> list[dict]:
+    """Public views of the actions, parallel to _load_actions() (clear alongside it)."""
+    return [_public_view(action) for action in _load_actions()]
+
+
+@lru_cache(maxsize=1)
+def _search_blobs() -> list[str]:
+    """Lower-cased name/description/id text per action, parallel to _load_actions().
+    
+    Kept outside the action dicts so it never leaks into tool responses
+    (clear alongside _load_actions).
+    """
+    return [
+        f"{action['name']}\n{action['description']}\n{action['id']}".lower()
+        for action in _load_actions()
+    ]
+
+
+@lru_cache(maxsize=128)
+def _query_pattern(query: str) -> re.Pattern:
+    """Compile a case-insensitive pattern matching any whitespace-separated term.
+    
+    Args:
+        query: Search query (e.g. 'slack message')
+        
+    Returns:
+        Compiled pattern to search against the lower-cased action blobs
+    """
+    terms = query.lower().split() or [query.lower()]
+    return re.compile("|".join(re.escape(term) for term in terms))
 
 
 @tool
@@ -32,25 +109,25 @@ def get_available_actions(query: Optional[str] = None) -> str:
     selecting one. Each action has an id, name, description, and API reference.
     
     Args:
-        query: Optional search term to filter actions (searches name and description)
+        query: Optional search terms to filter actions (searches name and description;
+            actions matching any term are returned)
     
     Returns:
         JSON string containing the list of available actions
     """
-    actions = _load_actions()
+    actions = _public_actions()
     
     # Filter if query provided
     if query:
-        query_lower = query.lower()
+        # Multi-word queries match actions containing any of the terms
+        pattern = _query_pattern(query)
         actions = [
-            a for a in actions
-            if query_lower in a["name"].lower() 
-            or query_lower in a["description"].lower()
-            or query_lower in a["id"].lower()
+            a for a, blob in zip(actions, _search_blobs())
+            if pattern.search(blob)
         ]
     
     if not actions:
-        return json.dumps({
+        return _to_json({
             "message": f"No actions found matching '{query}'",
             "available_count": len(_load_actions()),
             "suggestion": "Try a broader search or call without a query to see all actions"
@@ -62,23 +139,23 @@ def get_available_actions(query: Optional[str] = None) -> str:
         "actions": actions
     }
     
-    return json.dumps(result, indent=2)
+    return _to_json(result, indent=True)
 
 
+@lru_cache(maxsize=1)
 def get_actions_for_prompt() -> str:
     """Get a formatted string of actions suitable for prompts.
     
-    Returns a more readable format for including in system prompts.
+    Returns a more readable format for including in system prompts. The
+    catalog is static, so the string is built once (clear alongside
+    _load_actions).
     """
-    actions = _load_actions()
-    
-    lines = ["Available Integration Actions:"]
-    for action in actions:
-        lines.append(f"\n- **{action['id']}**: {action['name']}")
-        lines.append(f"  Description: {action['description']}")
-        lines.append(f"  API Reference: {action['api_reference']}")
-    
-    return "\n".join(lines)
+    return "Available Integration Actions:\n" + "\n".join(
+        f"\n- **{action['id']}**: {action['name']}"
+        f"\n  Description: {action['description']}"
+        f"\n  API Reference: {action['api_reference']}"
+        for action in _load_actions()
+    )
 
 
 def get_action_by_id(action_id: str) -> Optional[dict]:
@@ -90,11 +167,7 @@ def get_action_by_id(action_id: str) -> Optional[dict]:
     Returns:
         Action dict if found, None otherwise
     """
-    actions = _load_actions()
-    for action in actions:
-        if action["id"] == action_id:
-            return action
-    return None
+    return _actions_by_id().get(action_id)
 
 
 def validate_action_id(action_id: str) -> bool:
@@ -106,4 +179,4 @@ def validate_action_id(action_id: str) -> bool:
     Returns:
         True if the action exists, False otherwise
     """
-    return get_action_by_id(action_id) is not None
+    return action_id in _actions_by_id()
@@ -4,43 +4,25 @@ This tool allows the agent to retrieve relevant API documentation
 for a selected integration action to understand the payload structure.
 """
 
-import json
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 from langchain_core.tools import tool
 
-# Add project root to path
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.vector_store import get_vector_store, initialize_vector_store
-from tools.get_actions import get_action_by_id
-
-
-# Mapping from action IDs to integration names (for filtering)
-ACTION_TO_INTEGRATION = {
-    "google_sheets_create": "google_sheets",
-    "google_sheets_append": "google_sheets",
-    "notion_create_page": "notion",
-    "notion_update_block": "notion",
-    "slack_post_message": "slack",
-    "airtable_create_record": "airtable",
-    "hubspot_create_contact": "hubspot",
-    "github_create_issue": "github",
-    "trello_create_card": "trello",
-    "jira_create_issue": "jira",
-    "stripe_create_customer": "stripe",
-    "sendgrid_send_email": "sendgrid",
-    "twilio_send_sms": "twilio",
-}
-
-
-def _ensure_initialized():
-    """Ensure the vector store is initialized."""
+from src.vector_store import VectorStore, get_vector_store, initialize_vector_store
+from tools.get_actions import _from_json, _public_view, _to_json, get_action_by_id
+
+
+def _ensure_initialized() -> VectorStore:
+    """Ensure the vector store is initialized.
+    
+    Returns:
+        The default vector store, so callers need not look it up again
+    """
     store = get_vector_store()
     if store._vectorstore is None:
         initialize_vector_store()
+    return store
 
 
 @tool
@@ -57,37 +39,115 @@ def retrieve_api_documentation(action_id: str, query: Optional[str] = None) -> s
     Returns:
         Relevant API documentation including payload structure and examples
     """
-    _ensure_initialized()
+    # Normalize the refinement so trivially different phrasings (extra
+    # whitespace, an empty string) share one cache entry and one search
+    query = " ".join(query.split()) if query else None
+    return _retrieve_documentation(action_id.strip(), query or None)
+
+
+@lru_cache(maxsize=128)
+def _retrieve_documentation(action_id: str, query: Optional[str]) -> str:
+    """Look up and format the documentation for an action.
+    
+    Memoized on (action_id, query): the agent often re-requests the same
+    docs within a session, and results only change when the vector store
+    is rebuilt (call ``tools.cache_clear_all()`` after that).
+    
+    Args:
+        action_id: The integration action ID
+        query: Optional additional search terms
+        
+    Returns:
+        JSON string with the action and its documentation
+    """
+    store = _ensure_initialized()
     
     # Validate action
     action = get_action_by_id(action_id)
     if not action:
-        return json.dumps({
-            "error": f"Unknown action: {action_id}",
-            "suggestion": "Use get_available_actions tool first to see valid action IDs"
-        })
+        return _unknown_action(action_id)
     
-    # Get integration name for filtering
-    integration = ACTION_TO_INTEGRATION.get(action_id)
+    # Search the vector store, filtered to the action's integration docs
+    # (actions without one search all docs)
+    search_query = _build_search_query(action, query)
+    integration = action.get("integration")
+    results = store.search(search_query, k=4, filter_integration=integration)
     
-    # Build search query
-    search_query = f"{action['name']} {action['description']} payload structure"
-    if query:
-        search_query = f"{search_query} {query}"
+    # Widen to all docs only when the filter found nothing; running both
+    # searches up front would double the embedding requests on every call
+    if not results and integration:
+        results = store.search(search_query, k=4)
     
-    # Search the vector store
-    store = get_vector_store()
+    return _format_documentation(action, results)
+
+
+def retrieve_documentation_batch(action_ids: list[str], query: Optional[str] = None) -> list[str]:
+    """Retrieve documentation for several actions in one vector store lookup.
     
-    if integration:
-        # Filter to specific integration docs
-        results = store.search(search_query, k=4, filter_integration=integration)
-    else:
-        # No filter for unknown integrations
-        results = store.search(search_query, k=4)
+    Use this when one agent turn needs docs for multiple actions: all search
+    queries are embedded in a single request and searched together, instead
+    of one embedding and search round-trip per action.
+    
+    Args:
+        action_ids: The integration action IDs
+        query: Optional additional search terms applied to every action
+        
+    Returns:
+        One JSON string per action ID, in input order, formatted like
+        retrieve_api_documentation's output
+    """
+    store = _ensure_initialized()
+    
+    query = " ".join(query.split()) if query else None
+    action_ids = [action_id.strip() for action_id in action_ids]
+    responses: list[Optional[str]] = [None] * len(action_ids)
+    
+    pending = []
+    for i, action_id in enumerate(action_ids):
+        action = get_action_by_id(action_id)
+        if action:
+            pending.append((i, action))
+        else:
+            responses[i] = _unknown_action(action_id)
+    
+    if pending:
+        search_queries = [_build_search_query(action, query) for _, action in pending]
+        integrations = [action.get("integration") for _, action in pending]
+        results = store.batch_search(search_queries, k=4, filter_integrations=integrations)
+        
+        # Retry filtered searches that found nothing against all docs
+        empty = [j for j, docs in enumerate(results) if not docs and integrations[j]]
+        if empty:
+            widened = store.batch_search([search_queries[j] for j in empty], k=4)
+            for j, docs in zip(empty, widened):
+                results[j] = docs
+        for (i, action), docs in zip(pending, results):
+            responses[i] = _format_documentation(action, docs)
     
+    return responses
+
+
+def _unknown_action(action_id: str) -> str:
+    """Build the error response for an action ID not in the catalog."""
+    return _to_json({
+        "error": f"Unknown action: {action_id}",
+        "suggestion": "Use get_available_actions tool first to see valid action IDs"
+    })
+
+
+def _build_search_query(action: dict, query: Optional[str]) -> str:
+    """Build the vector store query for an action's documentation."""
+    search_query = f"{action['name']} {action['description']} payload structure"
+    if query:
+        search_query = f"{search_query} {query}"
+    return search_query
+
+
+def _format_documentation(action: dict, results: list) -> str:
+    """Combine retrieved chunks into the documentation response for an action."""
     if not results:
-        return json.dumps({
-            "action": action,
+        return _to_json({
+            "action": _public_view(action),
             "documentation": "No documentation found for this action.",
             "note": "You may need to use your knowledge of the API or ask the user for more details."
         })
@@ -97,22 +157,25 @@ def retrieve_api_documentation(action_id: str, query: Optional[str] = None) -> s
     seen_chunks = set()
     
     for doc in results:
-        # Deduplicate by content hash
-        content_hash = hash(doc.page_content[:100])
-        if content_hash in seen_chunks:
+        # Identical chunks of one integration share an index ID, so only the
+        # unfiltered fallback can return the same text twice (from different
+        # files); drop those by content hash, falling back to the chunk's
+        # opening text (strings hash themselves)
+        chunk_key = doc.metadata.get("content_hash") or doc.page_content[:100]
+        if chunk_key in seen_chunks:
             continue
-        seen_chunks.add(content_hash)
+        seen_chunks.add(chunk_key)
         
         doc_sections.append(doc.page_content)
     
     documentation = "\n\n---\n\n".join(doc_sections)
     
-    return json.dumps({
-        "action": action,
+    return _to_json({
+        "action": _public_view(action),
         "api_reference": action["api_reference"],
         "documentation": documentation,
         "chunks_retrieved": len(doc_sections)
-    }, indent=2)
+    }, indent=True)
 
 
 def get_documentation_for_action(action_id: str) -> str:
@@ -125,5 +188,5 @@ def get_documentation_for_action(action_id: str) -> str:
         Documentation string
     """
     result = retrieve_api_documentation.invoke({"action_id": action_id})
-    data = json.loads(result)
+    data = _from_json(result)
     return data.get("documentation", "")